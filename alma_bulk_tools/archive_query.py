@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import csv
-import io
+import functools
 import logging
+import math
 import re
+import time
 from collections import defaultdict
-from datetime import date, datetime, timedelta
-from typing import Any
+from datetime import date
+from typing import Any, Iterable, Iterator
 
 import requests
 
@@ -23,37 +25,67 @@ RANGE_RE = re.compile(
 INT_RE = re.compile(r"^\d+$")
 
 
+_QUOTE_TRANS = str.maketrans({"'": "''"})
+_BAND_TRANS = str.maketrans(";", ",")
+
+_TRUE_TOKENS = frozenset({"t", "true", "1", "y", "yes"})
+_FALSE_TOKENS = frozenset({"f", "false", "0", "n", "no"})
+_QA2_TRUE = frozenset({"t", "true", "1"})
+_QA2_FALSE = frozenset({"f", "false", "0"})
+_QA2_PASS_TOKENS = frozenset({"PASS", "P", "TRUE", "T", "1"})
+_QA2_SP_TOKENS = frozenset({"SP", "SEMIPASS", "SEMI-PASS", "S"})
+_QA2_FAIL_TOKENS = frozenset({"FAIL", "F", "FALSE", "0"})
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.translate(_QUOTE_TRANS) + "'"
+
+
+@functools.lru_cache(maxsize=128)
 def _date_to_mjd(value: str) -> float:
     dt = date.fromisoformat(value)
     epoch = date(1858, 11, 17)
     return float((dt - epoch).days)
 
 
+@functools.lru_cache(maxsize=128)
 def _band_number(token: str) -> str:
     text = parse_band_token(token)
     digits = "".join(ch for ch in text if ch.isdigit())
     return digits
 
 
-def _band_match_clause(token: str) -> str:
+@functools.lru_cache(maxsize=128)
+def _band_match_clause(token: str, *, compat: bool = False) -> str:
     num = _band_number(token)
     if not num:
-        band = parse_band_token(token)
+        band = parse_band_token(token).translate(_QUOTE_TRANS)
         return f"UPPER(band_list) LIKE '%{band}%'"
 
-    candidates = [
-        f"band_list = '{num}'",
-        f"band_list LIKE '{num},%'",
-        f"band_list LIKE '{num}, %'",
-        f"band_list LIKE '%,{num}'",
-        f"band_list LIKE '%, {num}'",
-        f"band_list LIKE '%,{num},%'",
-        f"band_list LIKE '%, {num},%'",
-        f"band_list LIKE '%,{num}, %'",
-        f"band_list LIKE '%, {num}, %'",
-        f"UPPER(band_list) LIKE '%BAND {num}%'",
-    ]
-    return "(" + " OR ".join(candidates) + ")"
+    if compat:
+        # Older expansion kept for TAP nodes where the normalized form below
+        # misbehaves; ten LIKEs per band instead of two.
+        candidates = [
+            f"band_list = '{num}'",
+            f"band_list LIKE '{num},%'",
+            f"band_list LIKE '{num}, %'",
+            f"band_list LIKE '%,{num}'",
+            f"band_list LIKE '%, {num}'",
+            f"band_list LIKE '%,{num},%'",
+            f"band_list LIKE '%, {num},%'",
+            f"band_list LIKE '%,{num}, %'",
+            f"band_list LIKE '%, {num}, %'",
+            f"UPPER(band_list) LIKE '%BAND {num}%'",
+        ]
+        return "(" + " OR ".join(candidates) + ")"
+
+    # Normalize the comma list server-side once (strip spaces, wrap in commas)
+    # so a single LIKE covers every spacing/position variant the old ten-way
+    # disjunction enumerated.
+    return (
+        f"(',' || REPLACE(band_list, ' ', '') || ',' LIKE '%,{num},%' "
+        f"OR UPPER(band_list) LIKE '%BAND {num}%')"
+    )
 
 
 def _build_where_clauses(
@@ -98,11 +130,9 @@ def _build_where_clauses(
         clauses.append(f"NOT {_band_match_clause(band)}")
 
     if project_codes_include:
-        joined = ",".join(f"'{p}'" for p in project_codes_include)
-        clauses.append(f"proposal_id IN ({joined})")
+        clauses.append("proposal_id IN (" + ",".join(map(_quote_literal, project_codes_include)) + ")")
     if project_codes_exclude:
-        joined = ",".join(f"'{p}'" for p in project_codes_exclude)
-        clauses.append(f"proposal_id NOT IN ({joined})")
+        clauses.append("proposal_id NOT IN (" + ",".join(map(_quote_literal, project_codes_exclude)) + ")")
 
     c_m_per_s = 299_792_458.0
     if min_freq_ghz is not None:
@@ -138,6 +168,10 @@ def build_adql_query(
 
     # Uses current documented ALMA ObsCore columns: member_ous_uid, group_ous_uid,
     # asdm_uid, qa2_passed, obs_release_date, band_list, proposal_id.
+    # Grouping stays client-side: archive_meta needs the per-row values of
+    # frequency_support, target_name, antenna_arrays, and spatial_resolution,
+    # and string aggregation (STRING_AGG) is not portable ADQL across the
+    # ALMA TAP mirrors.
     return (
         "SELECT "
         "proposal_id, member_ous_uid, group_ous_uid, asdm_uid, band_list, "
@@ -155,44 +189,119 @@ def run_tap_sync(
     *,
     timeout_sec: int,
     user_agent: str,
-) -> list[dict[str, str]]:
+) -> Iterator[dict[str, str]]:
     headers = {"User-Agent": user_agent}
+    # TSV avoids the quote-heavy CSV encoding of frequency_support (embedded
+    # commas force quoting in CSV), so the parser spends far less time in
+    # quote handling on large result sets.
     payload = {
         "REQUEST": "doQuery",
         "LANG": "ADQL",
-        "FORMAT": "csv",
+        "FORMAT": "tsv",
         "QUERY": adql,
     }
-    response = requests.post(tap_sync_url, data=payload, timeout=timeout_sec, headers=headers)
+    response = requests.post(
+        tap_sync_url, data=payload, timeout=timeout_sec, headers=headers, stream=True
+    )
+    try:
+        response.raise_for_status()
+        # TAP's text/tab-separated-values output never quotes fields, so
+        # QUOTE_NONE lets the C tokenizer skip quote handling entirely.
+        reader = csv.DictReader(
+            response.iter_lines(decode_unicode=True), delimiter="\t", quoting=csv.QUOTE_NONE
+        )
+        count = 0
+        for row in reader:
+            count += 1
+            yield row
+        LOGGER.info("TAP returned %s rows", count)
+    finally:
+        response.close()
+
+
+def _tap_async_url_from_sync(tap_sync_url: str) -> str:
+    base = tap_sync_url.rstrip("/")
+    if base.endswith("/sync"):
+        return base[: -len("sync")] + "async"
+    return base + "/async"
+
+
+def run_tap_async(
+    tap_async_url: str,
+    adql: str,
+    *,
+    timeout_sec: int,
+    user_agent: str,
+    poll_interval_sec: float = 2.0,
+) -> Iterator[dict[str, str]]:
+    """Run the query through the UWS async endpoint and stream the result.
+
+    The sync endpoint is capped by server-side execution limits; large date
+    windows go through async so the server can schedule the query and the
+    client is bounded only by its own timeout budget.
+    """
+    headers = {"User-Agent": user_agent}
+    payload = {
+        "REQUEST": "doQuery",
+        "LANG": "ADQL",
+        "FORMAT": "tsv",
+        "QUERY": adql,
+        "PHASE": "RUN",
+    }
+    response = requests.post(tap_async_url, data=payload, timeout=timeout_sec, headers=headers)
     response.raise_for_status()
-    text = response.text.strip()
-    if not text:
-        return []
-    reader = csv.DictReader(io.StringIO(text))
-    rows = [dict(row) for row in reader]
-    LOGGER.info("TAP returned %s rows", len(rows))
-    return rows
+    job_url = response.url.rstrip("/")
+    deadline = time.monotonic() + timeout_sec
+    while True:
+        phase_response = requests.get(f"{job_url}/phase", timeout=timeout_sec, headers=headers)
+        phase_response.raise_for_status()
+        phase = phase_response.text.strip().upper()
+        if phase == "COMPLETED":
+            break
+        if phase in {"ERROR", "ABORTED"}:
+            raise IOError(f"TAP async job ended in phase {phase}: {job_url}")
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"TAP async job still {phase} after {timeout_sec}s: {job_url}")
+        time.sleep(poll_interval_sec)
+    result = requests.get(
+        f"{job_url}/results/result", timeout=timeout_sec, headers=headers, stream=True
+    )
+    try:
+        result.raise_for_status()
+        reader = csv.DictReader(
+            result.iter_lines(decode_unicode=True), delimiter="\t", quoting=csv.QUOTE_NONE
+        )
+        count = 0
+        for row in reader:
+            count += 1
+            yield row
+        LOGGER.info("TAP async returned %s rows", count)
+    finally:
+        result.close()
 
 
-def _mjd_to_iso_date(value: str | None) -> str | None:
+_MJD_EPOCH_ORDINAL = date(1858, 11, 17).toordinal()
+
+
+def _mjd_to_iso_date(value: str | float | None) -> str | None:
     if value in (None, "", "NULL"):
         return None
     try:
         mjd = float(value)
     except ValueError:
         return None
-    epoch = datetime(1858, 11, 17)
-    dt = epoch + timedelta(days=mjd)
-    return dt.date().isoformat()
+    # Integer ordinal arithmetic; flooring matches the old
+    # epoch + timedelta(days=mjd) behavior for fractional days.
+    return date.fromordinal(_MJD_EPOCH_ORDINAL + math.floor(mjd)).isoformat()
 
 
 def _as_bool(value: Any) -> bool | None:
     if value is None:
         return None
     text = str(value).strip().lower()
-    if text in {"t", "true", "1", "y", "yes"}:
+    if text in _TRUE_TOKENS:
         return True
-    if text in {"f", "false", "0", "n", "no"}:
+    if text in _FALSE_TOKENS:
         return False
     return None
 
@@ -201,15 +310,11 @@ def _normalize_qa2_status(value: Any) -> str:
     if value is None:
         return "UNKNOWN"
     text = str(value).strip().upper()
-    if text in {"PASS", "P"}:
+    if text in _QA2_PASS_TOKENS:
         return "PASS"
-    if text in {"SP", "SEMIPASS", "SEMI-PASS", "S"}:
+    if text in _QA2_SP_TOKENS:
         return "SP"
-    if text in {"FAIL", "F"}:
-        return "FAIL"
-    if text in {"TRUE", "T", "1"}:
-        return "PASS"
-    if text in {"FALSE", "0"}:
+    if text in _QA2_FAIL_TOKENS:
         return "FAIL"
     return "UNKNOWN"
 
@@ -262,20 +367,29 @@ def _parse_frequency_support_details(value: str | None) -> list[tuple[float, int
     return details
 
 
+@functools.lru_cache(maxsize=1024)
+def _array_flags(arrays_raw: str) -> tuple[bool, bool, bool]:
+    arrays = arrays_raw.upper()
+    return (
+        "DV" in arrays or "DA" in arrays,
+        "CM" in arrays or "7M" in arrays,
+        "PM" in arrays or "TP" in arrays,
+    )
+
+
 def _array_label_from_rows(rows: list[dict[str, str]]) -> str:
     labels: list[str] = []
     has_12m = False
     has_7m = False
     has_tp = False
 
-    for row in rows:
-        arrays = (row.get("antenna_arrays") or "").upper()
-        if any(token in arrays for token in ("DV", "DA")):
-            has_12m = True
-        if "CM" in arrays or "7M" in arrays:
-            has_7m = True
-        if "PM" in arrays or "TP" in arrays:
-            has_tp = True
+    # antenna_arrays repeats verbatim across rows of an EB, so normalize and
+    # probe each distinct value once.
+    for arrays_raw in dict.fromkeys((row.get("antenna_arrays") or "") for row in rows):
+        is_12m, is_7m, is_tp = _array_flags(arrays_raw)
+        has_12m = has_12m or is_12m
+        has_7m = has_7m or is_7m
+        has_tp = has_tp or is_tp
 
     if has_12m and not labels:
         labels.append("12m")
@@ -310,145 +424,155 @@ def _infer_max_baseline_m(rows: list[dict[str, str]]) -> float | None:
     return max_baseline
 
 
-def group_rows_to_mous(rows: list[dict[str, str]], filters: dict[str, Any]) -> list[MousRecord]:
-    grouped: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {
-            "project_code": None,
-            "group_ous_uid": None,
-            "science_goal_uid": None,
-            "eb_uids": set(),
-            "bands": set(),
-            "release_date": None,
-            "obs_date": None,
-            "qa2_passed": None,
-            "qa2_status": "UNKNOWN",
-            "source_rows": 0,
-            "archive_meta": {
-                "sb_name": None,
-                "science_category": None,
-                "execution_count": 0,
-                "spw_count": None,
-                "min_spw_total_width_mhz": None,
-                "max_spw_total_width_mhz": None,
-                "min_nchan": None,
-                "max_nchan": None,
-                "min_spw_width_nchan": None,
-                "max_spw_width_nchan": None,
-                "array": "UNKNOWN",
-                "max_baseline_m": None,
-                "science_target_count": 0,
-                "is_mosaic": None,
-                "qa2_status": "UNKNOWN",
-            },
-            "science_targets": set(),
-            "execution_uids": set(),
-            "spw_details": [],
-            "spw_count_seen": 0,
-            "rows": [],
-        }
-    )
+def _record_sort_key(record: MousRecord) -> tuple[str, str, str]:
+    return (record.release_date or "", record.project_code, record.member_ous_uid)
+
+
+def group_rows_to_mous(rows: Iterable[dict[str, str]], filters: dict[str, Any]) -> list[MousRecord]:
+    # Phase 1: cheap bucketing only; all aggregation happens once per group so
+    # that expensive parsing runs per distinct value, not per TAP row.
+    grouped: dict[str, list[dict[str, str]]] = defaultdict(list)
     for row in rows:
         mous = (row.get("member_ous_uid") or "").strip()
         if not mous:
             continue
-        item = grouped[mous]
-        item["rows"].append(row)
-        item["source_rows"] += 1
-        if not item["project_code"]:
-            item["project_code"] = row.get("proposal_id")
-        if not item["group_ous_uid"]:
-            item["group_ous_uid"] = row.get("group_ous_uid")
-        if not item["archive_meta"].get("sb_name"):
-            item["archive_meta"]["sb_name"] = (row.get("schedblock_name") or "").strip() or None
-        if not item["archive_meta"].get("science_category"):
-            item["archive_meta"]["science_category"] = (row.get("scientific_category") or "").strip() or None
-        eb_uid = (row.get("asdm_uid") or "").strip()
-        if eb_uid:
-            item["eb_uids"].add(eb_uid)
-            item["execution_uids"].add(eb_uid)
-        band_raw = row.get("band_list") or ""
-        for token in band_raw.replace(";", ",").split(","):
-            token = token.strip()
-            if token:
-                item["bands"].add(parse_band_token(token))
-        release_date = (row.get("obs_release_date") or "").strip()
-        if release_date:
-            if item["release_date"] is None or release_date > item["release_date"]:
-                item["release_date"] = release_date
-        obs_date = _mjd_to_iso_date((row.get("t_min") or "").strip())
-        if obs_date:
-            if item["obs_date"] is None or obs_date < item["obs_date"]:
-                item["obs_date"] = obs_date
-        qa2 = (row.get("qa2_passed") or "").strip().lower()
-        if qa2 in {"t", "true", "1"}:
-            item["qa2_passed"] = True
-        elif qa2 in {"f", "false", "0"} and item["qa2_passed"] is None:
-            item["qa2_passed"] = False
-
-        qa2_status = _normalize_qa2_status(row.get("qa2_passed"))
-        if qa2_status == "FAIL":
-            item["qa2_status"] = "FAIL"
-        elif qa2_status == "SP" and item["qa2_status"] != "FAIL":
-            item["qa2_status"] = "SP"
-        elif qa2_status == "PASS" and item["qa2_status"] == "UNKNOWN":
-            item["qa2_status"] = "PASS"
-
-        details = _parse_frequency_support_details(row.get("frequency_support"))
-        item["spw_details"].extend(details)
-        item["spw_count_seen"] += len(details)
-
-        science_observation = _as_bool(row.get("science_observation"))
-        target_name = (row.get("target_name") or "").strip()
-        if target_name and science_observation is not False:
-            item["science_targets"].add(target_name)
-
-        is_mosaic = _as_bool(row.get("is_mosaic"))
-        if is_mosaic is True:
-            item["archive_meta"]["is_mosaic"] = True
-        elif item["archive_meta"]["is_mosaic"] is None and is_mosaic is False:
-            item["archive_meta"]["is_mosaic"] = False
+        grouped[mous].append(row)
 
     mous_include = set(load_list_from_value(filters.get("mous_include")))
     mous_exclude = set(load_list_from_value(filters.get("mous_exclude")))
 
+    # frequency_support strings repeat verbatim across EBs of the same SB, so
+    # parse each distinct value once. Keyed across groups deliberately.
+    spw_cache: dict[str, list[tuple[float, int | None]]] = {}
+
+    # Bind hot callables to locals; global lookups inside the group loop are
+    # measurable at 1e5+ rows.
+    as_float = _as_float
+    as_bool = _as_bool
+    normalize_qa2 = _normalize_qa2_status
+    parse_support = _parse_frequency_support_details
+    band_parse = parse_band_token
+    spw_cache_get = spw_cache.get
+
     out: list[MousRecord] = []
-    for mous_uid, item in grouped.items():
+    for mous_uid, group in grouped.items():
         if mous_include and mous_uid not in mous_include:
             continue
         if mous_uid in mous_exclude:
             continue
-        archive_meta = dict(item["archive_meta"])
-        sorted_details = sorted(item["spw_details"], key=lambda pair: (pair[0], pair[1] if pair[1] is not None else -1))
+
+        project_code = next((row.get("proposal_id") for row in group if row.get("proposal_id")), None)
+        group_ous_uid = next((row.get("group_ous_uid") for row in group if row.get("group_ous_uid")), None)
+        sb_name = next(
+            (name for name in ((row.get("schedblock_name") or "").strip() for row in group) if name), None
+        )
+        science_category = next(
+            (cat for cat in ((row.get("scientific_category") or "").strip() for row in group) if cat), None
+        )
+
+        eb_uids = {uid for uid in ((row.get("asdm_uid") or "").strip() for row in group) if uid}
+
+        bands: set[str] = set()
+        # dict.fromkeys dedups in first-seen order, keeping tokenization order
+        # deterministic (a set literal here would iterate in hash order).
+        for band_raw in dict.fromkeys(row.get("band_list") or "" for row in group):
+            for token in band_raw.translate(_BAND_TRANS).split(","):
+                token = token.strip()
+                if token:
+                    bands.add(band_parse(token))
+
+        release_date = max(
+            (value for value in ((row.get("obs_release_date") or "").strip() for row in group) if value),
+            default=None,
+        )
+        # Compare raw MJD floats and convert only the winner: MJD order and
+        # ISO-date order agree, so this is one calendar conversion per group.
+        min_mjd = min(
+            (value for value in (as_float((row.get("t_min") or "").strip()) for row in group) if value is not None),
+            default=None,
+        )
+        obs_date = _mjd_to_iso_date(min_mjd) if min_mjd is not None else None
+
+        qa2_raw = [(row.get("qa2_passed") or "").strip().lower() for row in group]
+        if any(value in _QA2_TRUE for value in qa2_raw):
+            qa2_passed: bool | None = True
+        elif any(value in _QA2_FALSE for value in qa2_raw):
+            qa2_passed = False
+        else:
+            qa2_passed = None
+
+        qa2_statuses = {normalize_qa2(row.get("qa2_passed")) for row in group}
+        if "FAIL" in qa2_statuses:
+            qa2_status = "FAIL"
+        elif "SP" in qa2_statuses:
+            qa2_status = "SP"
+        elif "PASS" in qa2_statuses:
+            qa2_status = "PASS"
+        else:
+            qa2_status = "UNKNOWN"
+
+        spw_details: list[tuple[float, int | None]] = []
+        for row in group:
+            support = row.get("frequency_support") or ""
+            details = spw_cache_get(support)
+            if details is None:
+                details = parse_support(support)
+                spw_cache[support] = details
+            spw_details.extend(details)
+
+        science_targets = {
+            name
+            for name, science_observation in (
+                ((row.get("target_name") or "").strip(), as_bool(row.get("science_observation")))
+                for row in group
+            )
+            if name and science_observation is not False
+        }
+
+        mosaic_flags = {as_bool(row.get("is_mosaic")) for row in group}
+        if True in mosaic_flags:
+            is_mosaic: bool | None = True
+        elif False in mosaic_flags:
+            is_mosaic = False
+        else:
+            is_mosaic = None
+
+        sorted_details = sorted(spw_details, key=lambda pair: (pair[0], pair[1] if pair[1] is not None else -1))
         widths_mhz = [pair[0] for pair in sorted_details]
         nchans = sorted(pair[1] for pair in sorted_details if pair[1] is not None)
-        archive_meta["execution_count"] = len(item["execution_uids"])
-        archive_meta["spw_count"] = item["spw_count_seen"] or None
-        archive_meta["min_spw_total_width_mhz"] = widths_mhz[0] if widths_mhz else None
-        archive_meta["max_spw_total_width_mhz"] = widths_mhz[-1] if widths_mhz else None
-        archive_meta["min_nchan"] = nchans[0] if nchans else None
-        archive_meta["max_nchan"] = nchans[-1] if nchans else None
-        archive_meta["min_spw_width_nchan"] = sorted_details[0][1] if sorted_details else None
-        archive_meta["max_spw_width_nchan"] = sorted_details[-1][1] if sorted_details else None
-        archive_meta["array"] = _array_label_from_rows(item["rows"])
-        archive_meta["max_baseline_m"] = _infer_max_baseline_m(item["rows"])
-        archive_meta["science_target_count"] = len(item["science_targets"])
-        archive_meta["qa2_status"] = item["qa2_status"]
+        archive_meta: dict[str, Any] = {
+            "sb_name": sb_name,
+            "science_category": science_category,
+            "execution_count": len(eb_uids),
+            "spw_count": len(spw_details) or None,
+            "min_spw_total_width_mhz": widths_mhz[0] if widths_mhz else None,
+            "max_spw_total_width_mhz": widths_mhz[-1] if widths_mhz else None,
+            "min_nchan": nchans[0] if nchans else None,
+            "max_nchan": nchans[-1] if nchans else None,
+            "min_spw_width_nchan": sorted_details[0][1] if sorted_details else None,
+            "max_spw_width_nchan": sorted_details[-1][1] if sorted_details else None,
+            "array": _array_label_from_rows(group),
+            "max_baseline_m": _infer_max_baseline_m(group),
+            "science_target_count": len(science_targets),
+            "is_mosaic": is_mosaic,
+            "qa2_status": qa2_status,
+        }
         out.append(
             MousRecord(
-                project_code=item["project_code"] or "UNKNOWN",
+                project_code=project_code or "UNKNOWN",
                 member_ous_uid=mous_uid,
-                group_ous_uid=item["group_ous_uid"],
-                science_goal_uid=item["science_goal_uid"],
-                eb_uids=sorted(item["eb_uids"]),
-                band_list=sorted(item["bands"]),
-                release_date=item["release_date"],
-                obs_date=item["obs_date"],
-                qa2_passed=item["qa2_passed"],
-                source_rows=item["source_rows"],
+                group_ous_uid=group_ous_uid,
+                science_goal_uid=None,
+                eb_uids=sorted(eb_uids),
+                band_list=sorted(bands),
+                release_date=release_date,
+                obs_date=obs_date,
+                qa2_passed=qa2_passed,
+                source_rows=len(group),
                 archive_meta=archive_meta,
             )
         )
-    out.sort(key=lambda r: (r.release_date or "", r.project_code, r.member_ous_uid))
+    out.sort(key=_record_sort_key)
     return out
 
 
@@ -463,11 +587,25 @@ def discover_mous(
     filters: dict[str, Any],
 ) -> tuple[list[MousRecord], str]:
     adql = build_adql_query(start=start, end=end, date_field=date_field, filters=filters)
-    rows = run_tap_sync(
-        tap_sync_url=tap_sync_url,
-        adql=adql,
-        timeout_sec=timeout_sec,
-        user_agent=user_agent,
-    )
+    try:
+        window_days = (date.fromisoformat(end) - date.fromisoformat(start)).days
+    except ValueError:
+        window_days = 0
+    if window_days > 30:
+        # Wide sweeps routinely exceed the sync endpoint's execution cap;
+        # route them through the UWS async job instead of one fragile sync call.
+        rows = run_tap_async(
+            _tap_async_url_from_sync(tap_sync_url),
+            adql,
+            timeout_sec=timeout_sec,
+            user_agent=user_agent,
+        )
+    else:
+        rows = run_tap_sync(
+            tap_sync_url=tap_sync_url,
+            adql=adql,
+            timeout_sec=timeout_sec,
+            user_agent=user_agent,
+        )
     records = group_rows_to_mous(rows, filters)
     return records, adql
@@ -1,36 +1,33 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
+import os
 import sys
-from dataclasses import asdict
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from dataclasses import fields
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
 from . import __version__
-from .archive_query import discover_mous
-from .config import apply_cli_overrides, load_config
-from .downloader import download_for_record, read_candidates_jsonl, write_candidates_jsonl
-from .index_db import connect_db, db_path_for, init_db, ingest_summary_file, upsert_mous_from_summary
-from .index_merge import merge_index_from_shards
-from .layout import (
-    MANIFEST_FILENAME,
-    SUMMARY_FILENAME,
-    ensure_layout_for_existing_mous,
-    ensure_mous_layout,
-    find_mous_dirs,
-)
 from .models import MousRecord
-from .sample import create_stratified_sample
-from .status import build_status_report, format_status_report
-from .summarize import summarize_mous
-from .unpack import unpack_mous_delivered
 from .utils import ensure_dir, load_json, now_utc_iso, setup_logging
 
+# Stage modules (TAP client, SQLite schema, tarfile, summarizer, ...) are
+# imported inside the _command_* function that needs them so --help, version,
+# and argument-error paths never pay their transitive import cost.
+
 LOGGER = logging.getLogger(__name__)
 
+# Commit the index transaction every this many MOUS so a crash loses at most
+# one batch instead of running the whole command in autocommit (one fsync per
+# record).
+DB_COMMIT_BATCH = 50
+
 
 def _parse_bands_override(value: str | None) -> tuple[list[str], list[str]]:
     if not value:
@@ -44,9 +41,13 @@ def _parse_bands_override(value: str | None) -> tuple[list[str], list[str]]:
 
 
 def _load_records_from_existing(dest: Path) -> list[MousRecord]:
+    from .layout import iter_mous_entries
+
     records: list[MousRecord] = []
-    for mous_dir in find_mous_dirs(dest):
-        manifest = load_json(mous_dir / MANIFEST_FILENAME, default={}) or {}
+    for _mous_dir, manifest_entry, _summary_entry in iter_mous_entries(dest):
+        if manifest_entry is None:
+            continue
+        manifest = load_json(Path(manifest_entry), default={}) or {}
         if not manifest.get("mous_uid"):
             continue
         records.append(
@@ -75,14 +76,13 @@ def _artifact_spec_from_cfg(cfg: dict[str, Any]) -> str:
     if explicit:
         return str(explicit)
 
-    selected: list[str] = []
-    for key, enabled in (dl.get("deliverables") or {}).items():
-        if enabled:
-            selected.append(str(key))
-    for key, enabled in (dl.get("products") or {}).items():
-        if enabled:
-            selected.append(str(key))
-    return ",".join(selected) if selected else "default"
+    selected = ",".join(
+        key
+        for section in ("deliverables", "products")
+        for key, enabled in (dl.get(section) or {}).items()
+        if enabled
+    )
+    return selected or "default"
 
 
 def _resolve_dest(args: argparse.Namespace, cfg: dict[str, Any]) -> Path:
@@ -105,17 +105,144 @@ def _write_plan_file(shard_files: list[Path], out_dir: Path, total_records: int,
     (out_dir / "plan.json").write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
 
 
-def _maybe_stop_for_runtime(started: datetime, max_runtime_min: int | None) -> bool:
+def _runtime_deadline(max_runtime_min: int | None) -> float | None:
+    """Monotonic-clock deadline for --max-runtime-min, or None when unset."""
     if not max_runtime_min:
+        return None
+    return time.monotonic() + max_runtime_min * 60
+
+
+@functools.lru_cache(maxsize=256)
+def _load_json_for_stat(path_str: str, _mtime_ns: int, _size: int) -> Any:
+    return load_json(Path(path_str), default=None)
+
+
+def _cached_load_json(path: Path, default: Any = None) -> Any:
+    """load_json memoized on (path, mtime, size) so re-reads of an unchanged
+    file within one invocation skip the second JSON parse."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return default
+    payload = _load_json_for_stat(str(path), stat.st_mtime_ns, stat.st_size)
+    if payload is None:
+        return default
+    # Shallow copy: callers add top-level keys like manifest_path.
+    return dict(payload) if isinstance(payload, dict) else payload
+
+
+# Layout dirs per (dest, MOUS uid), so repeat records and re-runs within one
+# process skip the mkdir/stat round-trips ensure_mous_layout would redo.
+_LAYOUT_CACHE: dict[tuple[str, str], dict[str, Path]] = {}
+
+
+def _ensure_mous_layout_cached(dest: Path, record: MousRecord) -> dict[str, Path]:
+    from .layout import ensure_mous_layout
+
+    key = (str(dest), record.member_ous_uid)
+    layout = _LAYOUT_CACHE.get(key)
+    if layout is None:
+        layout = _LAYOUT_CACHE[key] = ensure_mous_layout(dest, record)
+    return layout
+
+
+def _download_already_complete(manifest: dict[str, Any], selected_kinds: list[str]) -> bool:
+    """True when a prior download run already fetched this artifact selection.
+
+    Requires a matching download history entry and every recorded artifact
+    either present on disk or legitimately removed after unpacking; any error
+    or missing artifact forces another pass so retries still happen.
+    """
+    history = manifest.get("history") or []
+    if not any(
+        entry.get("event") == "download" and entry.get("selected_kinds") == selected_kinds
+        for entry in history
+    ):
         return False
-    return datetime.utcnow() >= started + timedelta(minutes=max_runtime_min)
+    artifacts = manifest.get("artifacts") or []
+    if not artifacts:
+        return False
+    from .downloader import _artifact_satisfied_without_archive_file
 
+    return all(
+        art.get("status") == "present" or _artifact_satisfied_without_archive_file(art)
+        for art in artifacts
+    )
 
-def _create_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="alma-bulk")
-    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
-    sub = parser.add_subparsers(dest="cmd", required=True)
 
+def _resolve_jobs(requested: int | None, task_count: int) -> int:
+    jobs = requested if requested and requested > 0 else max(1, (os.cpu_count() or 2) // 2)
+    return max(1, min(jobs, task_count))
+
+
+def _pool_results_until_deadline(pool: Any, worker: Any, tasks: list, *, window: int, deadline: float | None):
+    """Yield pool worker results, stopping dispatch (not workers) at the deadline.
+
+    Tasks are submitted a bounded window at a time with a deadline check
+    before each dispatch; once the budget runs out the in-flight MOUS still
+    finish and are yielded. Leaving the Pool context calls terminate(), which
+    would kill a worker mid-extraction, so each MOUS must complete before the
+    caller closes the pool.
+    """
+    pending: deque = deque()
+    tasks_iter = iter(tasks)
+    exhausted = False
+    while True:
+        while not exhausted and len(pending) < window:
+            if deadline is not None and time.monotonic() >= deadline:
+                exhausted = True
+                break
+            task = next(tasks_iter, None)
+            if task is None:
+                exhausted = True
+                break
+            pending.append(pool.apply_async(worker, (task,)))
+        if not pending:
+            break
+        yield pending.popleft().get()
+
+
+def _unpack_kwargs_from_cfg(cfg: dict[str, Any]) -> dict[str, Any]:
+    unpack_cfg = cfg.get("unpack") or {}
+    return {
+        "unpack_auxiliary": bool(unpack_cfg.get("unpack_auxiliary", True)),
+        "unpack_readme_archives": bool(unpack_cfg.get("unpack_readme_archives", True)),
+        "unpack_weblog_archives": bool(unpack_cfg.get("unpack_weblog_archives", True)),
+        "unpack_other_archives": bool(unpack_cfg.get("unpack_other_archives", False)),
+        "remove_archives_after_unpack": bool(unpack_cfg.get("remove_archives_after_unpack", True)),
+        "recursive_unpack_enabled": bool(unpack_cfg.get("recursive_unpack_enabled", True)),
+        "recursive_unpack_patterns": list(unpack_cfg.get("recursive_unpack_patterns", [])),
+        "recursive_unpack_max_passes": int(unpack_cfg.get("recursive_unpack_max_passes", 3)),
+    }
+
+
+def _unpack_worker(task: tuple[str, str], unpack_kwargs: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    from .unpack import unpack_mous_delivered
+
+    mous_dir_str, manifest_path_str = task
+    manifest = unpack_mous_delivered(
+        Path(mous_dir_str) / "delivered", Path(manifest_path_str), **unpack_kwargs
+    )
+    return mous_dir_str, manifest
+
+
+def _summarize_worker(
+    task: tuple[str, str], write_markdown: bool, query_timestamp: str, tool_version: str
+) -> tuple[str, dict[str, Any], dict[str, Any]]:
+    from .summarize import summarize_mous
+
+    mous_dir_str, manifest_path_str = task
+    summary, manifest = summarize_mous(
+        mous_dir=Path(mous_dir_str),
+        manifest_path=Path(manifest_path_str),
+        query_timestamp=query_timestamp,
+        tool_version=tool_version,
+        write_markdown=write_markdown,
+    )
+    return mous_dir_str, summary, manifest
+
+
+def _add_discover_parser(sub: argparse._SubParsersAction) -> None:
     discover = sub.add_parser("discover", help="Discover public MOUS candidates via ALMA TAP")
     discover.add_argument("--config", type=Path)
     discover.add_argument("--start", required=True)
@@ -128,27 +255,43 @@ def _create_parser() -> argparse.ArgumentParser:
     discover.add_argument("--project-code-exclude")
     discover.add_argument("--out", type=Path, required=True)
 
+
+def _add_download_parser(sub: argparse._SubParsersAction) -> None:
     download = sub.add_parser("download", help="Download selected archive deliverables")
     download.add_argument("--config", type=Path)
     download.add_argument("--input", type=Path)
     download.add_argument("--dest", type=Path)
     download.add_argument("--artifacts", default=None)
     download.add_argument("--max-workers", type=int, default=None)
+    download.add_argument(
+        "--record-jobs",
+        type=int,
+        default=1,
+        help="Records downloaded concurrently (default: 1); hides DataLink RTT across records",
+    )
     download.add_argument("--max-runtime-min", type=int, default=None)
 
+
+def _add_unpack_parser(sub: argparse._SubParsersAction) -> None:
     unpack = sub.add_parser("unpack", help="Unpack downloaded archive bundles")
     unpack.add_argument("--config", type=Path)
     unpack.add_argument("--dest", type=Path)
+    unpack.add_argument("--jobs", type=int, default=None, help="Worker processes (default: half the CPUs)")
     unpack.add_argument("--max-runtime-min", type=int, default=None)
 
+
+def _add_summarize_parser(sub: argparse._SubParsersAction) -> None:
     summarize = sub.add_parser("summarize", help="Generate per-MOUS summaries")
     summarize.add_argument("--config", type=Path)
     summarize.add_argument("--dest", type=Path)
     summarize.add_argument("--write-markdown", action="store_true")
     summarize.add_argument("--shard-id")
     summarize.add_argument("--index-db", type=Path)
+    summarize.add_argument("--jobs", type=int, default=None, help="Worker processes (default: half the CPUs)")
     summarize.add_argument("--max-runtime-min", type=int, default=None)
 
+
+def _add_scan_parser(sub: argparse._SubParsersAction) -> None:
     scan = sub.add_parser("scan", help="Scan existing trees and index manifests/summaries")
     scan.add_argument("--config", type=Path)
     scan.add_argument("--dest", type=Path)
@@ -156,12 +299,16 @@ def _create_parser() -> argparse.ArgumentParser:
     scan.add_argument("--rebuild-db", action="store_true")
     scan.add_argument("--index-db", type=Path)
 
+
+def _add_plan_parser(sub: argparse._SubParsersAction) -> None:
     plan = sub.add_parser("plan", help="Create shard files for batch processing")
     plan.add_argument("--config", type=Path)
     plan.add_argument("--input", type=Path, required=True)
     plan.add_argument("--out", type=Path, required=True)
     plan.add_argument("--shard-size", type=int, default=200)
 
+
+def _add_sample_parser(sub: argparse._SubParsersAction) -> None:
     sample = sub.add_parser("sample", help="Select a stratified sample from discover candidates")
     sample.add_argument("--config", type=Path)
     sample.add_argument("--input", type=Path, required=True)
@@ -171,6 +318,8 @@ def _create_parser() -> argparse.ArgumentParser:
     sample.add_argument("--seed", type=int, default=0)
     sample.add_argument("--max-per-project", type=int, default=2)
 
+
+def _add_run_shard_parser(sub: argparse._SubParsersAction) -> None:
     run_shard = sub.add_parser("run-shard", help="Process one shard (download optional, unpack, summarize, shard index)")
     run_shard.add_argument("--config", type=Path)
     run_shard.add_argument("--dest", type=Path)
@@ -179,6 +328,8 @@ def _create_parser() -> argparse.ArgumentParser:
     run_shard.add_argument("--max-workers", type=int, default=None)
     run_shard.add_argument("--max-runtime-min", type=int, default=None)
 
+
+def _add_merge_index_parser(sub: argparse._SubParsersAction) -> None:
     merge = sub.add_parser("merge-index", help="Merge shard outputs into central SQLite")
     merge.add_argument("--config", type=Path)
     merge.add_argument("--dest", type=Path)
@@ -186,31 +337,62 @@ def _create_parser() -> argparse.ArgumentParser:
     merge.add_argument("--vacuum", action="store_true")
     merge.add_argument("--integrity-check", action="store_true")
 
+
+def _add_status_parser(sub: argparse._SubParsersAction) -> None:
     status = sub.add_parser("status", help="Print index progress/failure dashboard")
     status.add_argument("--config", type=Path)
     status.add_argument("--dest", type=Path)
     status.add_argument("--top-n-errors", type=int, default=10)
 
+
+_SUBCOMMAND_BUILDERS: dict[str, Any] = {
+    "discover": _add_discover_parser,
+    "download": _add_download_parser,
+    "unpack": _add_unpack_parser,
+    "summarize": _add_summarize_parser,
+    "scan": _add_scan_parser,
+    "plan": _add_plan_parser,
+    "sample": _add_sample_parser,
+    "run-shard": _add_run_shard_parser,
+    "merge-index": _add_merge_index_parser,
+    "status": _add_status_parser,
+}
+
+
+def _create_parser(commands: list[str] | None = None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="alma-bulk")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    for cmd in (commands if commands is not None else _SUBCOMMAND_BUILDERS):
+        _SUBCOMMAND_BUILDERS[cmd](sub)
     return parser
 
 
-def _command_discover(args: argparse.Namespace) -> int:
-    cfg = load_config(args.config)
+def _command_discover(args: argparse.Namespace, cfg: dict[str, Any]) -> int:
+    from .archive_query import discover_mous
+    from .config import apply_cli_overrides
+    from .downloader import write_candidates_jsonl
+
     include_bands, exclude_bands = _parse_bands_override(args.bands)
-    cfg = apply_cli_overrides(
-        cfg,
-        {
-            "filters": {
-                "exclude_tp": args.exclude_tp or cfg["filters"].get("exclude_tp", False),
-                "exclude_7m": args.exclude_7m or cfg["filters"].get("exclude_7m", False),
-                "bands_include": include_bands or cfg["filters"].get("bands_include", []),
-                "bands_exclude": exclude_bands or cfg["filters"].get("bands_exclude", []),
-                "project_codes_include": args.project_code_include or cfg["filters"].get("project_codes_include", []),
-                "project_codes_exclude": args.project_code_exclude or cfg["filters"].get("project_codes_exclude", []),
-                "date_field": args.date_field or cfg["filters"].get("date_field", "release"),
-            }
-        },
-    )
+    # Only CLI-provided values go into the override dict; absent keys keep the
+    # config value without re-reading and re-merging every filter.
+    filter_overrides: dict[str, Any] = {}
+    if args.exclude_tp:
+        filter_overrides["exclude_tp"] = True
+    if args.exclude_7m:
+        filter_overrides["exclude_7m"] = True
+    if include_bands:
+        filter_overrides["bands_include"] = include_bands
+    if exclude_bands:
+        filter_overrides["bands_exclude"] = exclude_bands
+    if args.project_code_include:
+        filter_overrides["project_codes_include"] = args.project_code_include
+    if args.project_code_exclude:
+        filter_overrides["project_codes_exclude"] = args.project_code_exclude
+    if args.date_field:
+        filter_overrides["date_field"] = args.date_field
+    if filter_overrides:
+        cfg = apply_cli_overrides(cfg, {"filters": filter_overrides})
 
     records, adql = discover_mous(
         tap_sync_url=cfg["archive"]["tap_sync_url"],
@@ -227,7 +409,12 @@ def _command_discover(args: argparse.Namespace) -> int:
     return 0
 
 
-def _upsert_from_manifest_only(conn, manifest: dict[str, Any], mous_dir: Path, shard_id: str | None = None) -> None:
+def _upsert_from_manifest_only(
+    conn, manifest: dict[str, Any], mous_dir: Path, shard_id: str | None = None, commit: bool = True
+) -> None:
+    from .index_db import upsert_mous_from_summary
+    from .layout import MANIFEST_FILENAME, SUMMARY_FILENAME
+
     summary = {
         "mous_uid": manifest.get("mous_uid"),
         "project_code": manifest.get("project_code"),
@@ -253,209 +440,388 @@ def _upsert_from_manifest_only(conn, manifest: dict[str, Any], mous_dir: Path, s
         manifest=manifest,
         local_dir=str(mous_dir),
         shard_id=shard_id,
+        commit=commit,
     )
 
 
-def _command_download(args: argparse.Namespace) -> int:
-    cfg = load_config(args.config)
-    dest = _resolve_dest(args, cfg)
-    cfg = apply_cli_overrides(
-        cfg,
-        {
-            "download": {
-                "artifacts": args.artifacts,
-                "max_workers": args.max_workers,
-            },
-            "runtime": {
-                "max_runtime_min": args.max_runtime_min,
-            },
-        },
+def _command_download(args: argparse.Namespace, cfg: dict[str, Any]) -> int:
+    from .config import apply_cli_overrides
+    from .downloader import (
+        ManifestCache,
+        download_for_record,
+        read_candidates_jsonl,
+        resolve_artifact_selection,
     )
+    from .index_db import connect_db, db_path_for, init_db
+
+    dest = _resolve_dest(args, cfg)
+    overrides: dict[str, Any] = {}
+    if args.artifacts is not None:
+        overrides.setdefault("download", {})["artifacts"] = args.artifacts
+    if args.max_workers is not None:
+        overrides.setdefault("download", {})["max_workers"] = args.max_workers
+    if args.max_runtime_min is not None:
+        overrides["runtime"] = {"max_runtime_min": args.max_runtime_min}
+    if overrides:
+        cfg = apply_cli_overrides(cfg, overrides)
 
     if args.input:
-        records = read_candidates_jsonl(args.input)
+        records_iter = read_candidates_jsonl(args.input)
     else:
-        records = _load_records_from_existing(dest)
-    if not records:
+        records_iter = iter(_load_records_from_existing(dest))
+    first = next(records_iter, None)
+    if first is None:
         print("No MOUS records found to download")
         return 0
+    records = chain([first], records_iter)
 
-    started = datetime.utcnow()
+    deadline = _runtime_deadline(cfg["runtime"].get("max_runtime_min"))
     dbp = db_path_for(dest)
     conn = connect_db(dbp)
     init_db(conn)
     artifact_spec = _artifact_spec_from_cfg(cfg)
+    selected_kinds = sorted(resolve_artifact_selection(artifact_spec))
+
+    # One session for the whole run keeps keepalive connections warm across
+    # records instead of re-handshaking per MOUS.
+    import requests
+
+    session = requests.Session()
+    session.headers.update({"User-Agent": cfg["archive"]["user_agent"]})
+    # Manifest writes are buffered and flushed every few records; on an
+    # interrupted run the delivered files on disk let the next pass recover.
+    manifest_cache = ManifestCache()
+    # One aggregate bar for the whole run; total is unknown while streaming
+    # records, so it counts artifacts as they finish.
+    from tqdm import tqdm
+
+    progress = tqdm(desc="artifacts", unit="file")
+
+    record_jobs = max(1, args.record_jobs or 1)
+    # Split the per-record worker budget across concurrent records so total
+    # connection count stays at the configured max_workers.
+    max_workers = int(cfg["download"]["max_workers"])
+    inner_workers = max(1, max_workers // record_jobs) if record_jobs > 1 else max_workers
+
+    fetch = functools.partial(
+        download_for_record,
+        datalink_sync_url=cfg["archive"]["datalink_sync_url"],
+        timeout_sec=int(cfg["archive"]["timeout_sec"]),
+        user_agent=cfg["archive"]["user_agent"],
+        artifacts_spec=artifact_spec,
+        max_workers=inner_workers,
+        retry_count=int(cfg["download"].get("retry_count", 3)),
+        rate_limit_sec=float(cfg["download"].get("rate_limit_sec", 0.0)),
+        compute_sha256=bool(cfg["download"].get("compute_sha256", False)),
+        session=session,
+        manifest_cache=manifest_cache,
+        progress=progress,
+    )
 
     processed = 0
-    for record in records:
-        layout = ensure_mous_layout(dest, record)
-        manifest = download_for_record(
-            record=record,
-            delivered_dir=layout["delivered"],
-            manifest_path=layout["manifest"],
-            datalink_sync_url=cfg["archive"]["datalink_sync_url"],
-            timeout_sec=int(cfg["archive"]["timeout_sec"]),
-            user_agent=cfg["archive"]["user_agent"],
-            artifacts_spec=artifact_spec,
-            max_workers=int(cfg["download"]["max_workers"]),
-            retry_count=int(cfg["download"].get("retry_count", 3)),
-            rate_limit_sec=float(cfg["download"].get("rate_limit_sec", 0.0)),
-            compute_sha256=bool(cfg["download"].get("compute_sha256", False)),
-        )
-        _upsert_from_manifest_only(conn, manifest, layout["mous_dir"])
+    skipped = 0
+
+    def _ingest(manifest: dict[str, Any], mous_dir: Path) -> None:
+        nonlocal processed
+        _upsert_from_manifest_only(conn, manifest, mous_dir, commit=False)
         processed += 1
+        if processed % DB_COMMIT_BATCH == 0:
+            conn.commit()
+
+    if record_jobs > 1:
+        # Record-level threads hide the DataLink round trip of record N+1
+        # behind the downloads of record N; SQLite upserts stay on this
+        # thread so the index has a single writer.
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        with ThreadPoolExecutor(max_workers=record_jobs) as rec_pool:
+            outstanding: dict[Any, Path] = {}
+            for record in records:
+                layout = _ensure_mous_layout_cached(dest, record)
+                existing = _cached_load_json(layout["manifest"])
+                if existing and _download_already_complete(existing, selected_kinds):
+                    _upsert_from_manifest_only(conn, existing, layout["mous_dir"], commit=False)
+                    skipped += 1
+                    continue
+                fut = rec_pool.submit(
+                    fetch,
+                    record=record,
+                    delivered_dir=layout["delivered"],
+                    manifest_path=layout["manifest"],
+                )
+                outstanding[fut] = layout["mous_dir"]
+                while len(outstanding) >= record_jobs * 2:
+                    done, _pending = wait(outstanding, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        _ingest(fut.result(), outstanding.pop(fut))
+                if deadline is not None and time.monotonic() >= deadline:
+                    LOGGER.info("Stopping due to max runtime after %s MOUS", processed)
+                    break
+            for fut, mous_dir in outstanding.items():
+                _ingest(fut.result(), mous_dir)
+    else:
+        for record in records:
+            layout = _ensure_mous_layout_cached(dest, record)
+            existing = _cached_load_json(layout["manifest"])
+            if existing and _download_already_complete(existing, selected_kinds):
+                # Keep the index row fresh, but skip the datalink round-trip.
+                _upsert_from_manifest_only(conn, existing, layout["mous_dir"], commit=False)
+                skipped += 1
+                continue
+            manifest = fetch(
+                record=record,
+                delivered_dir=layout["delivered"],
+                manifest_path=layout["manifest"],
+            )
+            _ingest(manifest, layout["mous_dir"])
 
-        if _maybe_stop_for_runtime(started, cfg["runtime"].get("max_runtime_min")):
-            LOGGER.info("Stopping due to max runtime after %s MOUS", processed)
-            break
+            if deadline is not None and time.monotonic() >= deadline:
+                LOGGER.info("Stopping due to max runtime after %s MOUS", processed)
+                break
 
+    progress.close()
+    manifest_cache.flush()
+    conn.commit()
     conn.close()
-    print(f"Download stage completed for {processed} MOUS")
+    session.close()
+    if skipped:
+        print(f"Download stage completed for {processed} MOUS ({skipped} already complete)")
+    else:
+        print(f"Download stage completed for {processed} MOUS")
     return 0
 
 
-def _command_unpack(args: argparse.Namespace) -> int:
-    cfg = load_config(args.config)
+def _command_unpack(args: argparse.Namespace, cfg: dict[str, Any]) -> int:
+    from .config import apply_cli_overrides
+    from .index_db import connect_db, db_path_for, init_db
+    from .layout import MANIFEST_FILENAME, iter_mous_entries
+
     dest = _resolve_dest(args, cfg)
-    cfg = apply_cli_overrides(cfg, {"runtime": {"max_runtime_min": args.max_runtime_min}})
+    if args.max_runtime_min is not None:
+        cfg = apply_cli_overrides(cfg, {"runtime": {"max_runtime_min": args.max_runtime_min}})
 
-    mous_dirs = find_mous_dirs(dest)
-    started = datetime.utcnow()
+    unpack_kwargs = _unpack_kwargs_from_cfg(cfg)
+    tasks = [
+        (str(mous_dir), str(mous_dir / MANIFEST_FILENAME))
+        for mous_dir, manifest_entry, _summary_entry in iter_mous_entries(dest)
+        if manifest_entry is not None
+    ]
+
+    deadline = _runtime_deadline(cfg["runtime"].get("max_runtime_min"))
     conn = connect_db(db_path_for(dest))
     init_db(conn)
+    jobs = _resolve_jobs(args.jobs, len(tasks))
     done = 0
-    for mous_dir in mous_dirs:
-        manifest_path = mous_dir / MANIFEST_FILENAME
-        if not manifest_path.exists():
-            continue
-        manifest = unpack_mous_delivered(
-            mous_dir / "delivered",
-            manifest_path,
-            unpack_auxiliary=bool(cfg.get("unpack", {}).get("unpack_auxiliary", True)),
-            unpack_readme_archives=bool(
-                cfg.get("unpack", {}).get("unpack_readme_archives", True)
-            ),
-            unpack_weblog_archives=bool(
-                cfg.get("unpack", {}).get("unpack_weblog_archives", True)
-            ),
-            unpack_other_archives=bool(cfg.get("unpack", {}).get("unpack_other_archives", False)),
-            remove_archives_after_unpack=bool(
-                cfg.get("unpack", {}).get("remove_archives_after_unpack", True)
-            ),
-            recursive_unpack_enabled=bool(
-                cfg.get("unpack", {}).get("recursive_unpack_enabled", True)
-            ),
-            recursive_unpack_patterns=list(
-                cfg.get("unpack", {}).get("recursive_unpack_patterns", [])
-            ),
-            recursive_unpack_max_passes=int(
-                cfg.get("unpack", {}).get("recursive_unpack_max_passes", 3)
-            ),
-        )
-        _upsert_from_manifest_only(conn, manifest, mous_dir)
-        done += 1
-        if _maybe_stop_for_runtime(started, cfg["runtime"].get("max_runtime_min")):
-            LOGGER.info("Stopping due to max runtime after %s MOUS", done)
-            break
+    if jobs > 1:
+        # Tar extraction is independent per MOUS; only the SQLite upserts stay
+        # on this process so the index writer is never contended.
+        import multiprocessing
+
+        worker = functools.partial(_unpack_worker, unpack_kwargs=unpack_kwargs)
+        with multiprocessing.Pool(jobs) as pool:
+            # Deadline-aware dispatch: hitting --max-runtime-min stops new
+            # submissions and drains the in-flight MOUS before the pool is
+            # torn down, so no worker dies between unlink and manifest write.
+            results = _pool_results_until_deadline(
+                pool, worker, tasks, window=jobs * 2, deadline=deadline
+            )
+            for mous_dir_str, manifest in results:
+                _upsert_from_manifest_only(conn, manifest, Path(mous_dir_str), commit=False)
+                done += 1
+                if done % DB_COMMIT_BATCH == 0:
+                    conn.commit()
+            if deadline is not None and time.monotonic() >= deadline:
+                LOGGER.info("Stopping due to max runtime after %s MOUS", done)
+            pool.close()
+            pool.join()
+    else:
+        for task in tasks:
+            mous_dir_str, manifest = _unpack_worker(task, unpack_kwargs=unpack_kwargs)
+            _upsert_from_manifest_only(conn, manifest, Path(mous_dir_str), commit=False)
+            done += 1
+            if done % DB_COMMIT_BATCH == 0:
+                conn.commit()
+            if deadline is not None and time.monotonic() >= deadline:
+                LOGGER.info("Stopping due to max runtime after %s MOUS", done)
+                break
+    conn.commit()
     conn.close()
     print(f"Unpack stage completed for {done} MOUS")
     return 0
 
 
-def _command_summarize(args: argparse.Namespace) -> int:
-    cfg = load_config(args.config)
+def _command_summarize(args: argparse.Namespace, cfg: dict[str, Any]) -> int:
+    from .config import apply_cli_overrides
+    from .index_db import connect_db, db_path_for, init_db, upsert_mous_from_summary
+    from .layout import MANIFEST_FILENAME, SUMMARY_FILENAME, iter_mous_entries
+
     dest = _resolve_dest(args, cfg)
-    cfg = apply_cli_overrides(cfg, {"runtime": {"max_runtime_min": args.max_runtime_min}})
+    if args.max_runtime_min is not None:
+        cfg = apply_cli_overrides(cfg, {"runtime": {"max_runtime_min": args.max_runtime_min}})
 
-    started = datetime.utcnow()
+    deadline = _runtime_deadline(cfg["runtime"].get("max_runtime_min"))
     shard_id = args.shard_id
     index_db_path = args.index_db or db_path_for(dest)
     conn = connect_db(index_db_path)
     init_db(conn)
 
-    done = 0
-    for mous_dir in find_mous_dirs(dest):
-        manifest_path = mous_dir / MANIFEST_FILENAME
-        if not manifest_path.exists():
-            continue
-        summary = summarize_mous(
-            mous_dir=mous_dir,
-            manifest_path=manifest_path,
-            query_timestamp=now_utc_iso(),
-            tool_version=__version__,
-            write_markdown=bool(args.write_markdown),
-        )
-        manifest = load_json(manifest_path, default={}) or {}
+    tasks = [
+        (str(mous_dir), str(mous_dir / MANIFEST_FILENAME))
+        for mous_dir, manifest_entry, _summary_entry in iter_mous_entries(dest)
+        if manifest_entry is not None
+    ]
+    worker = functools.partial(
+        _summarize_worker,
+        write_markdown=bool(args.write_markdown),
+        query_timestamp=now_utc_iso(),
+        tool_version=__version__,
+    )
+    jobs = _resolve_jobs(args.jobs, len(tasks))
+
+    def _ingest(mous_dir_str: str, summary: dict[str, Any], manifest: dict[str, Any]) -> None:
+        mous_dir = Path(mous_dir_str)
         summary["summary_path"] = str(mous_dir / SUMMARY_FILENAME)
-        manifest["manifest_path"] = str(manifest_path)
+        manifest["manifest_path"] = str(mous_dir / MANIFEST_FILENAME)
         upsert_mous_from_summary(
             conn,
             summary=summary,
             manifest=manifest,
             local_dir=str(mous_dir),
             shard_id=shard_id,
+            commit=False,
         )
-        done += 1
-        if _maybe_stop_for_runtime(started, cfg["runtime"].get("max_runtime_min")):
-            LOGGER.info("Stopping due to max runtime after %s MOUS", done)
-            break
 
+    done = 0
+    if jobs > 1:
+        import multiprocessing
+
+        with multiprocessing.Pool(jobs) as pool:
+            # Same deadline handling as unpack: stop dispatching, finish the
+            # in-flight MOUS, never terminate a worker mid-summary.
+            results = _pool_results_until_deadline(
+                pool, worker, tasks, window=jobs * 2, deadline=deadline
+            )
+            for mous_dir_str, summary, manifest in results:
+                _ingest(mous_dir_str, summary, manifest)
+                done += 1
+                if done % DB_COMMIT_BATCH == 0:
+                    conn.commit()
+            if deadline is not None and time.monotonic() >= deadline:
+                LOGGER.info("Stopping due to max runtime after %s MOUS", done)
+            pool.close()
+            pool.join()
+    else:
+        for task in tasks:
+            mous_dir_str, summary, manifest = worker(task)
+            _ingest(mous_dir_str, summary, manifest)
+            done += 1
+            if done % DB_COMMIT_BATCH == 0:
+                conn.commit()
+            if deadline is not None and time.monotonic() >= deadline:
+                LOGGER.info("Stopping due to max runtime after %s MOUS", done)
+                break
+
+    conn.commit()
     conn.close()
     print(f"Summarize stage completed for {done} MOUS")
     return 0
 
 
-def _command_scan(args: argparse.Namespace) -> int:
-    cfg = load_config(args.config)
+def _command_scan(args: argparse.Namespace, cfg: dict[str, Any]) -> int:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .index_db import connect_db, db_path_for, init_db, load_summary_pair, upsert_mous_batch
+    from .layout import (
+        MANIFEST_FILENAME,
+        SUMMARY_FILENAME,
+        ensure_layout_for_existing_mous,
+        iter_mous_entries,
+    )
+
     dest = _resolve_dest(args, cfg)
     dbp = args.index_db or db_path_for(dest)
-    if args.rebuild_db and dbp.exists():
-        dbp.unlink()
+    if args.rebuild_db:
+        dbp.unlink(missing_ok=True)
 
     conn = connect_db(dbp)
     init_db(conn)
 
-    mous_dirs = find_mous_dirs(dest)
-    ensure_layout_for_existing_mous(mous_dirs, args.fix_layout)
+    if args.fix_layout:
+        entries = list(iter_mous_entries(dest))
+        ensure_layout_for_existing_mous((mous_dir for mous_dir, _m, _s in entries), True)
+    else:
+        entries = iter_mous_entries(dest)
+
+    def _parse(mous_dir: Path):
+        try:
+            summary, manifest = load_summary_pair(mous_dir / SUMMARY_FILENAME, mous_dir / MANIFEST_FILENAME)
+        except Exception as exc:  # noqa: BLE001
+            return mous_dir, None, exc
+        return mous_dir, (summary, manifest), None
+
+    candidates = (
+        mous_dir
+        for mous_dir, manifest_entry, summary_entry in entries
+        if summary_entry is not None or manifest_entry is not None
+    )
 
+    # Reader threads parse the JSON pairs while this thread stays the sole
+    # SQLite writer, flushing one executemany batch per DB_COMMIT_BATCH MOUS.
     count = 0
-    for mous_dir in mous_dirs:
-        summary_path = mous_dir / SUMMARY_FILENAME
-        manifest_path = mous_dir / MANIFEST_FILENAME
-        if summary_path.exists() or manifest_path.exists():
-            try:
-                ingest_summary_file(
-                    conn,
-                    summary_path=summary_path,
-                    manifest_path=manifest_path,
-                    shard_id=None,
-                )
-                count += 1
-            except Exception as exc:  # noqa: BLE001
+    pending: list[dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for mous_dir, parsed, exc in pool.map(_parse, candidates):
+            if parsed is None:
                 LOGGER.warning("Skipping %s due to ingest error: %s", mous_dir, exc)
-
+                continue
+            summary, manifest = parsed
+            pending.append(
+                {
+                    "summary": summary,
+                    "manifest": manifest,
+                    "local_dir": str(mous_dir),
+                    "shard_id": None,
+                }
+            )
+            count += 1
+            if len(pending) >= DB_COMMIT_BATCH:
+                upsert_mous_batch(conn, pending, commit=False)
+                pending.clear()
+                conn.commit()
+    if pending:
+        upsert_mous_batch(conn, pending, commit=False)
+
+    conn.commit()
     conn.close()
     print(f"Scanned and indexed {count} MOUS directories")
     return 0
 
 
-def _command_plan(args: argparse.Namespace) -> int:
-    records = read_candidates_jsonl(args.input)
+def _command_plan(args: argparse.Namespace, cfg: dict[str, Any]) -> int:
+    from .downloader import read_candidates_jsonl
+
+    records = list(read_candidates_jsonl(args.input))
     if not records:
         print("No records to shard")
         return 0
     out_dir = ensure_dir(args.out)
-    records = sorted(records, key=lambda r: r.member_ous_uid)
+    records.sort(key=lambda r: r.member_ous_uid)
 
     shard_files: list[Path] = []
     shard_size = max(1, args.shard_size)
+    # MousRecord fields are plain lists/scalars, so a flat getattr dict avoids
+    # the recursive copy asdict() would do per record.
+    field_names = tuple(f.name for f in fields(MousRecord))
+    dumps = json.dumps
     for idx in range(0, len(records), shard_size):
         chunk = records[idx : idx + shard_size]
         shard_idx = idx // shard_size
         shard_path = out_dir / f"part-{shard_idx:04d}.jsonl"
-        with shard_path.open("w", encoding="utf-8") as handle:
-            for rec in chunk:
-                handle.write(json.dumps(asdict(rec)) + "\n")
+        with shard_path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+            handle.writelines(
+                dumps({name: getattr(rec, name) for name in field_names}, separators=(",", ":")) + "\n"
+                for rec in chunk
+            )
         shard_files.append(shard_path)
 
     _write_plan_file(shard_files, out_dir, len(records), shard_size)
@@ -463,8 +829,11 @@ def _command_plan(args: argparse.Namespace) -> int:
     return 0
 
 
-def _command_sample(args: argparse.Namespace) -> int:
-    records = read_candidates_jsonl(args.input)
+def _command_sample(args: argparse.Namespace, cfg: dict[str, Any]) -> int:
+    from .downloader import read_candidates_jsonl
+    from .sample import create_stratified_sample
+
+    records = list(read_candidates_jsonl(args.input))
     if not records:
         print("No candidate records to sample")
         return 0
@@ -491,32 +860,48 @@ def _command_sample(args: argparse.Namespace) -> int:
     return 0
 
 
-def _command_run_shard(args: argparse.Namespace) -> int:
-    cfg = load_config(args.config)
-    dest = _resolve_dest(args, cfg)
-    cfg = apply_cli_overrides(
-        cfg,
-        {
-            "download": {"max_workers": args.max_workers},
-            "runtime": {"max_runtime_min": args.max_runtime_min},
-        },
-    )
+def _command_run_shard(args: argparse.Namespace, cfg: dict[str, Any]) -> int:
+    from .config import apply_cli_overrides
+    from .downloader import download_for_record, read_candidates_jsonl
+    from .index_db import connect_db, init_db, upsert_mous_from_summary
+    from .summarize import summarize_mous
+    from .unpack import unpack_mous_delivered
 
-    records = read_candidates_jsonl(args.shard)
-    if not records:
+    dest = _resolve_dest(args, cfg)
+    overrides: dict[str, Any] = {}
+    if args.max_workers is not None:
+        overrides["download"] = {"max_workers": args.max_workers}
+    if args.max_runtime_min is not None:
+        overrides["runtime"] = {"max_runtime_min": args.max_runtime_min}
+    if overrides:
+        cfg = apply_cli_overrides(cfg, overrides)
+
+    records_iter = read_candidates_jsonl(args.shard)
+    first = next(records_iter, None)
+    if first is None:
         print(f"Shard is empty: {args.shard}")
         return 0
+    records = chain([first], records_iter)
 
     shard_id = args.shard.stem
     shard_db_path = args.shard.with_suffix(".sqlite")
     conn = connect_db(shard_db_path)
     init_db(conn)
 
-    started = datetime.utcnow()
+    deadline = _runtime_deadline(cfg["runtime"].get("max_runtime_min"))
     artifact_spec = _artifact_spec_from_cfg(cfg)
+    unpack_kwargs = _unpack_kwargs_from_cfg(cfg)
+
+    session = None
+    if args.download_missing:
+        import requests
+
+        session = requests.Session()
+        session.headers.update({"User-Agent": cfg["archive"]["user_agent"]})
+
     done = 0
     for record in records:
-        layout = ensure_mous_layout(dest, record)
+        layout = _ensure_mous_layout_cached(dest, record)
 
         if args.download_missing:
             manifest = download_for_record(
@@ -531,9 +916,10 @@ def _command_run_shard(args: argparse.Namespace) -> int:
                 retry_count=int(cfg["download"].get("retry_count", 3)),
                 rate_limit_sec=float(cfg["download"].get("rate_limit_sec", 0.0)),
                 compute_sha256=bool(cfg["download"].get("compute_sha256", False)),
+                session=session,
             )
         else:
-            manifest = load_json(layout["manifest"], default={}) or {}
+            manifest = _cached_load_json(layout["manifest"], default={}) or {}
 
         if not layout["manifest"].exists():
             manifest = {
@@ -555,40 +941,17 @@ def _command_run_shard(args: argparse.Namespace) -> int:
             layout["manifest"].write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
 
         if layout["manifest"].exists():
-            unpack_mous_delivered(
-                layout["delivered"],
-                layout["manifest"],
-                unpack_auxiliary=bool(cfg.get("unpack", {}).get("unpack_auxiliary", True)),
-                unpack_readme_archives=bool(
-                    cfg.get("unpack", {}).get("unpack_readme_archives", True)
-                ),
-                unpack_weblog_archives=bool(
-                    cfg.get("unpack", {}).get("unpack_weblog_archives", True)
-                ),
-                unpack_other_archives=bool(cfg.get("unpack", {}).get("unpack_other_archives", False)),
-                remove_archives_after_unpack=bool(
-                    cfg.get("unpack", {}).get("remove_archives_after_unpack", True)
-                ),
-                recursive_unpack_enabled=bool(
-                    cfg.get("unpack", {}).get("recursive_unpack_enabled", True)
-                ),
-                recursive_unpack_patterns=list(
-                    cfg.get("unpack", {}).get("recursive_unpack_patterns", [])
-                ),
-                recursive_unpack_max_passes=int(
-                    cfg.get("unpack", {}).get("recursive_unpack_max_passes", 3)
-                ),
-            )
+            manifest = unpack_mous_delivered(layout["delivered"], layout["manifest"], **unpack_kwargs)
 
-        summary = summarize_mous(
+        summary, manifest = summarize_mous(
             mous_dir=layout["mous_dir"],
             manifest_path=layout["manifest"],
             query_timestamp=now_utc_iso(),
             tool_version=__version__,
             write_markdown=False,
+            manifest=manifest,
         )
         summary["summary_path"] = str(layout["summary"])
-        manifest = load_json(layout["manifest"], default=manifest) or {}
         manifest["manifest_path"] = str(layout["manifest"])
 
         upsert_mous_from_summary(
@@ -597,19 +960,27 @@ def _command_run_shard(args: argparse.Namespace) -> int:
             manifest=manifest,
             local_dir=str(layout["mous_dir"]),
             shard_id=shard_id,
+            commit=False,
         )
         done += 1
-        if _maybe_stop_for_runtime(started, cfg["runtime"].get("max_runtime_min")):
+        if done % DB_COMMIT_BATCH == 0:
+            conn.commit()
+        if deadline is not None and time.monotonic() >= deadline:
             LOGGER.info("Stopping due to max runtime after %s MOUS", done)
             break
 
+    conn.commit()
     conn.close()
+    if session is not None:
+        session.close()
     print(f"Processed {done} MOUS from shard {args.shard} into {shard_db_path}")
     return 0
 
 
-def _command_merge_index(args: argparse.Namespace) -> int:
-    cfg = load_config(args.config)
+def _command_merge_index(args: argparse.Namespace, cfg: dict[str, Any]) -> int:
+    from .index_db import db_path_for
+    from .index_merge import merge_index_from_shards
+
     dest = _resolve_dest(args, cfg)
     central_db = db_path_for(dest)
     result = merge_index_from_shards(
@@ -627,8 +998,10 @@ def _command_merge_index(args: argparse.Namespace) -> int:
     return 0
 
 
-def _command_status(args: argparse.Namespace) -> int:
-    cfg = load_config(args.config)
+def _command_status(args: argparse.Namespace, cfg: dict[str, Any]) -> int:
+    from .index_db import connect_db, db_path_for
+    from .status import build_status_report, format_status_report
+
     dest = _resolve_dest(args, cfg)
     dbp = db_path_for(dest)
     if not dbp.exists():
@@ -641,41 +1014,49 @@ def _command_status(args: argparse.Namespace) -> int:
     return 0
 
 
+_COMMAND_HANDLERS: dict[str, Any] = {
+    "discover": _command_discover,
+    "download": _command_download,
+    "unpack": _command_unpack,
+    "summarize": _command_summarize,
+    "scan": _command_scan,
+    "plan": _command_plan,
+    "sample": _command_sample,
+    "run-shard": _command_run_shard,
+    "merge-index": _command_merge_index,
+    "status": _command_status,
+}
+
+
 def main(argv: list[str] | None = None) -> int:
-    parser = _create_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    # The first non-flag token is the subcommand (only --version/--help may
+    # precede it); registering just that one subparser skips building the
+    # other nine argument sets. Unknown tokens fall back to the full parser
+    # so help and error output are unchanged.
+    command = next((token for token in argv if not token.startswith("-")), None)
+    parser = _create_parser([command] if command in _SUBCOMMAND_BUILDERS else None)
     args = parser.parse_args(argv)
 
+    handler = _COMMAND_HANDLERS.get(args.cmd)
+    if handler is None:
+        parser.error(f"Unhandled command: {args.cmd}")
+        return 2
+
+    # Config and logging setup happen only once a runnable command is in
+    # hand; --help/--version and argument errors have already exited above.
+    from .config import load_config
+
     cfg = load_config(getattr(args, "config", None))
     setup_logging(cfg.get("runtime", {}).get("log_level", "INFO"))
 
     try:
-        if args.cmd == "discover":
-            return _command_discover(args)
-        if args.cmd == "download":
-            return _command_download(args)
-        if args.cmd == "unpack":
-            return _command_unpack(args)
-        if args.cmd == "summarize":
-            return _command_summarize(args)
-        if args.cmd == "scan":
-            return _command_scan(args)
-        if args.cmd == "plan":
-            return _command_plan(args)
-        if args.cmd == "sample":
-            return _command_sample(args)
-        if args.cmd == "run-shard":
-            return _command_run_shard(args)
-        if args.cmd == "merge-index":
-            return _command_merge_index(args)
-        if args.cmd == "status":
-            return _command_status(args)
+        return handler(args, cfg)
     except ValueError as exc:
         parser.error(str(exc))
         return 2
 
-    parser.error(f"Unhandled command: {args.cmd}")
-    return 2
-
 
 def _single_command_main(cmd: str) -> int:
     return main([cmd, *sys.argv[1:]])
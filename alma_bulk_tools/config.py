@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import csv
+import functools
 import json
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:  # libyaml-backed loader; ~10x faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader
+
 DEFAULT_CONFIG: dict[str, Any] = {
     "paths": {
         "dest": None,
@@ -83,6 +89,10 @@ DEFAULT_CONFIG: dict[str, Any] = {
     },
 }
 
+# Serialized once at import; loads-from-string is cheaper than the previous
+# dumps+loads round trip per load_config call.
+_DEFAULT_CONFIG_JSON = json.dumps(DEFAULT_CONFIG)
+
 
 def _deep_update(base: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any]:
     for key, value in updates.items():
@@ -93,32 +103,122 @@ def _deep_update(base: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any
     return base
 
 
+def _load_config_payload(path: Path) -> Any:
+    """Parse the YAML config, preferring a fresh JSON sidecar cache.
+
+    JSON parsing is much cheaper than YAML, so the first successful parse
+    writes ``<config>.cache.json`` next to the file and later invocations use
+    it while its mtime is at least as new as the YAML. Cache reads and writes
+    are best-effort: unreadable, stale, or unwritable caches fall back to the
+    YAML parse silently.
+    """
+    cache_path = path.with_suffix(path.suffix + ".cache.json")
+    try:
+        if cache_path.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            return json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    with path.open("r", encoding="utf-8") as handle:
+        payload = yaml.load(handle, Loader=_YamlLoader) or {}
+    try:
+        encoded = json.dumps(payload)
+        # Only cache payloads the JSON round trip reproduces exactly; JSON
+        # stringifies non-string mapping keys (e.g. numeric YAML keys), and a
+        # cache that parses differently from the YAML must never be served.
+        if json.loads(encoded) == payload:
+            cache_path.write_text(encoded, encoding="utf-8")
+    except (OSError, TypeError):
+        # TypeError: YAML values JSON cannot represent (dates, ...); skip the
+        # cache rather than serve something that round-trips differently.
+        pass
+    return payload
+
+
 def load_config(config_path: str | Path | None) -> dict[str, Any]:
-    cfg = json.loads(json.dumps(DEFAULT_CONFIG))
+    cfg = json.loads(_DEFAULT_CONFIG_JSON)
     if not config_path:
         return cfg
     path = Path(config_path)
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
-    with path.open("r", encoding="utf-8") as handle:
-        payload = yaml.safe_load(handle) or {}
+    payload = _load_config_payload(path)
     if not isinstance(payload, dict):
         raise ValueError("Config root must be a mapping")
     _deep_update(cfg, payload)
     return cfg
 
 
-def apply_cli_overrides(cfg: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
-    def _drop_none(value: Any) -> Any:
+def _deep_update_skip_none(base: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any]:
+    """Merge ``updates`` into ``base``, ignoring None values, in one pass.
+
+    Overrides are flag-shaped (scalars, lists of scalars, nested dicts), so a
+    separate drop-None rewrite of the whole tree before merging would just
+    traverse and allocate twice.
+    """
+    for key, value in updates.items():
+        if value is None:
+            continue
         if isinstance(value, dict):
-            return {k: _drop_none(v) for k, v in value.items() if v is not None}
-        if isinstance(value, list):
-            return [_drop_none(v) for v in value if v is not None]
-        return value
+            if isinstance(base.get(key), dict):
+                _deep_update_skip_none(base[key], value)
+            else:
+                base[key] = _deep_update_skip_none({}, value)
+        elif isinstance(value, list):
+            base[key] = [v for v in value if v is not None]
+        else:
+            base[key] = value
+    return base
 
-    cleaned = _drop_none(overrides)
-    _deep_update(cfg, cleaned)
-    return cfg
+
+def apply_cli_overrides(cfg: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
+    return _deep_update_skip_none(cfg, overrides)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_list_file(path_str: str, _mtime_ns: int, _size: int) -> tuple[str, ...]:
+    """Parse an allowlist file into a tuple, cached on (path, mtime, size).
+
+    Tuples keep the cache entries immutable; callers copy into lists. The stat
+    key makes edits to the file invalidate naturally.
+    """
+    path = Path(path_str)
+    suffix = path.suffix.lower()
+    if suffix in {".yaml", ".yml"}:
+        payload = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
+        if isinstance(payload, list):
+            return tuple(str(v).strip() for v in payload if str(v).strip())
+        if isinstance(payload, dict):
+            out: list[str] = []
+            for v in payload.values():
+                if isinstance(v, list):
+                    out.extend([str(i).strip() for i in v if str(i).strip()])
+                elif v is not None and str(v).strip():
+                    out.append(str(v).strip())
+            return tuple(out)
+        return ()
+    if suffix == ".json":
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(payload, list):
+            return tuple(str(v).strip() for v in payload if str(v).strip())
+        if isinstance(payload, dict):
+            return tuple(str(v).strip() for v in payload.values() if str(v).strip())
+        return ()
+    if suffix == ".csv":
+        out = []
+        with path.open("r", encoding="utf-8") as handle:
+            reader = csv.reader(handle)
+            for row in reader:
+                for cell in row:
+                    cell = cell.strip()
+                    if cell:
+                        out.append(cell)
+        return tuple(out)
+    out = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        value = line.strip()
+        if value and not value.startswith("#"):
+            out.append(value)
+    return tuple(out)
 
 
 def load_list_from_value(value: Any) -> list[str]:
@@ -129,40 +229,7 @@ def load_list_from_value(value: Any) -> list[str]:
     if isinstance(value, str):
         path = Path(value)
         if path.exists() and path.is_file():
-            suffix = path.suffix.lower()
-            if suffix in {".yaml", ".yml"}:
-                payload = yaml.safe_load(path.read_text(encoding="utf-8"))
-                if isinstance(payload, list):
-                    return [str(v).strip() for v in payload if str(v).strip()]
-                if isinstance(payload, dict):
-                    out: list[str] = []
-                    for v in payload.values():
-                        if isinstance(v, list):
-                            out.extend([str(i).strip() for i in v if str(i).strip()])
-                        elif v is not None and str(v).strip():
-                            out.append(str(v).strip())
-                    return out
-            if suffix == ".json":
-                payload = json.loads(path.read_text(encoding="utf-8"))
-                if isinstance(payload, list):
-                    return [str(v).strip() for v in payload if str(v).strip()]
-                if isinstance(payload, dict):
-                    return [str(v).strip() for v in payload.values() if str(v).strip()]
-            if suffix == ".csv":
-                out = []
-                with path.open("r", encoding="utf-8") as handle:
-                    reader = csv.reader(handle)
-                    for row in reader:
-                        for cell in row:
-                            cell = cell.strip()
-                            if cell:
-                                out.append(cell)
-                return out
-            out = []
-            for line in path.read_text(encoding="utf-8").splitlines():
-                value = line.strip()
-                if value and not value.startswith("#"):
-                    out.append(value)
-            return out
+            st = path.stat()
+            return list(_parse_list_file(str(path), st.st_mtime_ns, st.st_size))
         return [s.strip() for s in value.split(",") if s.strip()]
     return [str(value).strip()]
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import io
 import json
 import logging
 import os
+import re
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 from urllib.parse import parse_qs, urlparse
 import xml.etree.ElementTree as ET
 import csv
@@ -44,6 +47,13 @@ def _normalize_kind(kind: str) -> str:
     return (kind or "").strip().lower()
 
 
+def _to_int(value: str | None) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def _filename_from_url(url: str) -> str:
     parsed = urlparse(url)
     if parsed.path:
@@ -56,50 +66,70 @@ def _filename_from_url(url: str) -> str:
     return "download.dat"
 
 
+# Classification needles compiled into one alternation per source string, so
+# each filename/semantics value is scanned once instead of once per rule.
+# Group order mirrors the priority of the old if/elif chain; "cont" and
+# "image" stay separate groups because "admit" ranks between them.
+_NAME_CLASSIFIER_RE = re.compile(
+    "|".join(
+        (
+            "(?P<readme>readme)",
+            "(?P<weblog>weblog)",
+            "(?P<qa_reports>qa0_report|qa2_report|qa/|aquareport)",
+            "(?P<auxiliary>auxiliary|auxproducts)",
+            "(?P<scripts>scriptforpi)",
+            r"(?P<calibration>calibration|\.cal$)",
+            "(?P<calibration_products>calimage)",
+            "(?P<cubes>cube)",
+            "(?P<cont>cont)",
+            "(?P<admit>admit)",
+            "(?P<image>image)",
+            "(?P<raw>asdm|raw)",
+        )
+    )
+)
+_SEMANTICS_CLASSIFIER_RE = re.compile(
+    "|".join(
+        (
+            "(?P<readme>readme|documentation)",
+            "(?P<weblog>weblog)",
+            "(?P<qa_reports>/qa/|#qa|qa2)",
+            "(?P<auxiliary>auxiliary)",
+            "(?P<scripts>script)",
+            "(?P<calibration>calibration)",
+            "(?P<calibration_products>calimage)",
+        )
+    )
+)
+_CLASSIFY_PRIORITY = (
+    "readme",
+    "weblog",
+    "qa_reports",
+    "auxiliary",
+    "scripts",
+    "calibration",
+    "calibration_products",
+    "cubes",
+    "cont",
+    "admit",
+    "image",
+    "raw",
+)
+_CLASSIFY_KIND = {"cont": "continuum_images", "image": "continuum_images"}
+
+
 def _classify_artifact(kind_hint: str, semantics: str | None, filename: str) -> str:
     name = filename.lower()
     semantics_l = (semantics or "").lower()
-    hint = kind_hint.lower()
-
-    if "readme" in name or "readme" in semantics_l or "documentation" in semantics_l:
-        return "readme"
-    if "weblog" in name or "weblog" in semantics_l:
-        return "weblog"
-    if (
-        "qa0_report" in name
-        or "qa2_report" in name
-        or "qa/" in name
-        or "/qa/" in semantics_l
-        or "#qa" in semantics_l
-        or "qa2" in semantics_l
-        or "aquareport" in name
-    ):
-        return "qa_reports"
-    if (
-        "auxiliary" in name
-        or "#auxiliary" in semantics_l
-        or "auxiliary" in semantics_l
-        or "auxproducts" in name
-    ):
-        return "auxiliary"
-    if "scriptforpi" in name or "script" in semantics_l:
-        return "scripts"
-    if "calibration" in name or name.endswith(".cal") or "calibration" in semantics_l:
-        return "calibration"
-    if "calimage" in name or "calimage" in semantics_l:
-        return "calibration_products"
-    if "cube" in name:
-        return "cubes"
-    if "cont" in name:
-        return "continuum_images"
-    if "admit" in name:
-        return "admit"
-    if "image" in name:
-        return "continuum_images"
-    if "asdm" in name or "raw" in name:
-        return "raw"
-    if hint:
-        return _normalize_kind(hint)
+
+    found = {m.lastgroup for m in _NAME_CLASSIFIER_RE.finditer(name)}
+    if semantics_l:
+        found.update(m.lastgroup for m in _SEMANTICS_CLASSIFIER_RE.finditer(semantics_l))
+    for group in _CLASSIFY_PRIORITY:
+        if group in found:
+            return _CLASSIFY_KIND.get(group, group)
+    if kind_hint:
+        return _normalize_kind(kind_hint)
     return "other"
 
 
@@ -129,7 +159,9 @@ def resolve_artifact_selection(spec: str) -> set[str]:
 
 
 def _artifact_selected(kind: str, selected_kinds: set[str]) -> bool:
-    return _normalize_kind(kind) in selected_kinds
+    # ArtifactInfo.kind comes out of _classify_artifact already normalized, so
+    # no per-check strip/lower here.
+    return kind in selected_kinds
 
 
 def _artifact_satisfied_without_archive_file(entry: dict[str, Any] | None) -> bool:
@@ -155,64 +187,81 @@ def fetch_datalink_artifacts(
     member_ous_uid: str,
     timeout_sec: int,
     user_agent: str,
+    session: requests.Session | None = None,
 ) -> list[ArtifactInfo]:
     headers = {"User-Agent": user_agent}
     datalink_id = datalink_id_from_member_ous_uid(member_ous_uid)
-    response = requests.get(
+    get = requests.get if session is None else session.get
+    response = get(
         datalink_sync_url,
         params={"ID": datalink_id},
         timeout=timeout_sec,
         headers=headers,
     )
     response.raise_for_status()
-    root = ET.fromstring(response.content)
-
-    ns = {
-        "v": "http://www.ivoa.net/xml/VOTable/v1.3",
-        "v1": "http://www.ivoa.net/xml/VOTable/v1.1",
-        "v2": "http://www.ivoa.net/xml/VOTable/v1.2",
-    }
 
-    table = None
-    for xpath in [".//v:TABLE", ".//v1:TABLE", ".//v2:TABLE", ".//TABLE"]:
-        table = root.find(xpath, ns)
-        if table is not None:
+    # One iterparse pass with the namespace stripped from each tag replaces
+    # the four findall sweeps per VOTable namespace variant. FIELD and TR
+    # elements are collected until the first TABLE closes, matching the old
+    # first-TABLE semantics; TR elements are cleared as they are consumed to
+    # cap memory on large responses.
+    fields: list[str] = []
+    rows: list[list[str]] = []
+    for _event, elem in ET.iterparse(io.BytesIO(response.content), events=("end",)):
+        tag = elem.tag
+        if "}" in tag:
+            tag = tag.rsplit("}", 1)[1]
+        if tag == "FIELD":
+            fields.append((elem.get("name") or elem.get("ID") or "").strip())
+        elif tag == "TR":
+            # Raw text here; _cell strips lazily, only for columns we read.
+            rows.append([td.text or "" for td in elem])
+            elem.clear()
+        elif tag == "TABLE":
             break
-    if table is None:
+    if not fields or not rows:
         return []
 
-    fields = []
-    for fld in table.findall("./v:FIELD", ns) + table.findall("./v1:FIELD", ns) + table.findall(
-        "./v2:FIELD", ns
-    ) + table.findall("./FIELD"):
-        key = (fld.get("name") or fld.get("ID") or "").strip()
-        fields.append(key)
+    # Resolve the handful of columns we care about to positions once; building
+    # a dict per row just to pull seven keys back out allocates and hashes for
+    # nothing on large DataLink responses.
+    def _column(*names: str) -> int | None:
+        for name in names:
+            if name in fields:
+                return fields.index(name)
+        return None
+
+    idx_url = _column("access_url", "accessURL")
+    idx_semantics = _column("semantics")
+    idx_qualifier = _column("content_qualifier")
+    idx_description = _column("description")
+    idx_content_type = _column("content_type")
+    idx_length = _column("content_length")
+    idx_checksum = _column("checksum")
+
+    def _cell(values: list[str], idx: int | None) -> str | None:
+        if idx is None or idx >= len(values):
+            return None
+        return values[idx].strip() or None
 
     artifacts: list[ArtifactInfo] = []
-    trs = table.findall(".//v:TR", ns) + table.findall(".//v1:TR", ns) + table.findall(
-        ".//v2:TR", ns
-    ) + table.findall(".//TR")
-
-    for tr in trs:
-        values = [td.text.strip() if td.text else "" for td in list(tr)]
-        row = {fields[i]: values[i] for i in range(min(len(fields), len(values)))}
-        url = row.get("access_url") or row.get("accessURL")
+    for values in rows:
+        url = _cell(values, idx_url)
         if not url:
             continue
         filename = _filename_from_url(url)
-        semantics = row.get("semantics") or row.get("content_qualifier")
-        description = row.get("description")
+        semantics = _cell(values, idx_semantics) or _cell(values, idx_qualifier)
+        description = _cell(values, idx_description)
         kind = _classify_artifact("", semantics, filename)
-        size = row.get("content_length")
-        size_bytes = int(size) if size and size.isdigit() else None
-        checksum = row.get("checksum")
+        size_bytes = _to_int(_cell(values, idx_length))
+        checksum = _cell(values, idx_checksum)
         artifacts.append(
             ArtifactInfo(
                 kind=kind,
                 url=url,
                 filename=filename,
                 semantics=semantics,
-                content_type=row.get("content_type"),
+                content_type=_cell(values, idx_content_type),
                 size_bytes=size_bytes,
                 checksum=checksum,
                 description=description,
@@ -241,6 +290,7 @@ def _read_manifest(manifest_path: Path, record: MousRecord) -> dict[str, Any]:
         payload["qa0_reasons"] = payload.get("qa0_reasons") or record.qa0_reasons
         payload["qa2_reasons"] = payload.get("qa2_reasons") or record.qa2_reasons
         return payload
+    created_ts = now_utc_iso()
     return {
         "mous_uid": record.member_ous_uid,
         "project_code": record.project_code,
@@ -254,8 +304,8 @@ def _read_manifest(manifest_path: Path, record: MousRecord) -> dict[str, Any]:
         "qa0_status": record.qa0_status,
         "qa0_reasons": record.qa0_reasons,
         "qa2_reasons": record.qa2_reasons,
-        "created_at": now_utc_iso(),
-        "updated_at": now_utc_iso(),
+        "created_at": created_ts,
+        "updated_at": created_ts,
         "artifacts": [],
         "history": [],
     }
@@ -266,12 +316,71 @@ def _save_manifest(manifest_path: Path, payload: dict[str, Any]) -> None:
     atomic_write_json(manifest_path, payload)
 
 
-def _artifact_exists(loc: Path, expected_size: int | None) -> bool:
-    if not loc.exists():
+class ManifestCache:
+    """Write-back buffer for MOUS manifests across a bulk run.
+
+    ``download_for_record`` rewrites its whole manifest on completion; over
+    thousands of mostly-complete records that is a serialize+rename per MOUS.
+    With a cache, dirty manifests are flushed every ``flush_every`` records
+    (bounding loss on interruption) and once more by the driver's final
+    ``flush()``. Writes stay atomic per manifest. A lock makes the cache safe
+    to share when records are downloaded concurrently; each record still owns
+    its manifest dict exclusively.
+    """
+
+    def __init__(self, flush_every: int = 16) -> None:
+        self._manifests: dict[Path, dict[str, Any]] = {}
+        self._dirty: set[Path] = set()
+        self._flush_every = max(1, flush_every)
+        self._lock = threading.Lock()
+
+    def read(self, manifest_path: Path, record: MousRecord) -> dict[str, Any]:
+        with self._lock:
+            manifest = self._manifests.get(manifest_path)
+            if manifest is None:
+                manifest = _read_manifest(manifest_path, record)
+                self._manifests[manifest_path] = manifest
+            return manifest
+
+    def mark_dirty(self, manifest_path: Path) -> None:
+        with self._lock:
+            self._dirty.add(manifest_path)
+            if len(self._dirty) < self._flush_every:
+                return
+            to_flush = self._drain_locked()
+        self._write(to_flush)
+
+    def flush(self) -> None:
+        with self._lock:
+            to_flush = self._drain_locked()
+        self._write(to_flush)
+
+    def _drain_locked(self) -> list[tuple[Path, dict[str, Any]]]:
+        # Records are visited once per run, so flushed entries can be evicted;
+        # memory stays bounded by flush_every manifests.
+        drained = [(path, self._manifests.pop(path)) for path in sorted(self._dirty)]
+        self._dirty.clear()
+        return drained
+
+    @staticmethod
+    def _write(to_flush: list[tuple[Path, dict[str, Any]]]) -> None:
+        for manifest_path, manifest in to_flush:
+            _save_manifest(manifest_path, manifest)
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """Single stat() with the miss folded in; callers reuse the result instead
+    of issuing separate exists()/stat() calls (each a real RPC on Lustre/NFS)."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _artifact_exists(st: os.stat_result | None, expected_size: int | None) -> bool:
+    if st is None:
         return False
-    if expected_size is None:
-        return True
-    return loc.stat().st_size == expected_size
+    return expected_size is None or st.st_size == expected_size
 
 
 def _download_one(
@@ -282,15 +391,19 @@ def _download_one(
     timeout_sec: int,
     retry_count: int,
     rate_limit_sec: float,
-) -> tuple[str, str | None, int | None]:
+    compute_sha256: bool,
+) -> tuple[str, str | None, int | None, str | None]:
     ensure_dir(local_path.parent)
     temp_path = local_path.with_suffix(local_path.suffix + ".part")
 
-    downloaded = temp_path.stat().st_size if temp_path.exists() else 0
     expected = artifact.size_bytes
 
+    # Stat the .part file once; afterwards the write loop tracks the byte
+    # count itself, so retries and the final size check need no further stats.
+    st = _stat_or_none(temp_path)
+    downloaded = st.st_size if st is not None else 0
+
     for attempt in range(1, retry_count + 1):
-        downloaded = temp_path.stat().st_size if temp_path.exists() else 0
         headers = {}
         mode = "wb"
         if downloaded > 0:
@@ -308,31 +421,51 @@ def _download_one(
                     downloaded = 0
                     mode = "wb"
                 resp.raise_for_status()
-                with temp_path.open(mode) as handle:
-                    for chunk in resp.iter_content(chunk_size=1024 * 1024):
-                        if chunk:
-                            handle.write(chunk)
-                final_size = temp_path.stat().st_size
+                # Copy straight from the raw socket in 8 MiB blocks with an
+                # unbuffered file: fewer, larger syscalls and no BufferedWriter
+                # copy per chunk. decode_content keeps gzip handling intact.
+                resp.raw.decode_content = True
+                read = resp.raw.read
+                with open(temp_path, mode, buffering=0) as handle:
+                    while True:
+                        block = read(8 * 1024 * 1024)
+                        if not block:
+                            break
+                        # A raw write may be short (realistic on Lustre/NFS);
+                        # keep writing the unwritten tail so the byte count
+                        # never drifts from what is actually on disk.
+                        mv = memoryview(block)
+                        while mv:
+                            written = handle.write(mv)
+                            downloaded += written
+                            mv = mv[written:]
+                final_size = downloaded
                 if expected is not None and final_size != expected:
                     raise IOError(
                         f"Size mismatch for {local_path.name}: expected {expected}, got {final_size}"
                     )
                 os.replace(temp_path, local_path)
+                # Hash inside the worker so it overlaps with other downloads
+                # and reads data still hot in the page cache.
+                checksum = sha256_file(local_path) if compute_sha256 else None
                 if rate_limit_sec > 0:
                     time.sleep(rate_limit_sec)
-                return "ok", None, local_path.stat().st_size
+                return "ok", None, final_size, checksum
         except Exception as exc:  # noqa: BLE001
             if attempt == retry_count:
-                return "error", str(exc), None
+                return "error", str(exc), None, None
+            # An aborted write may be short of what we counted; re-sync the
+            # resume offset from disk before retrying.
+            st = _stat_or_none(temp_path)
+            downloaded = st.st_size if st is not None else 0
             time.sleep(min(2**attempt, 10))
-    return "error", "retry exhausted", None
+    return "error", "retry exhausted", None, None
 
 
-def _entry_lookup(manifest: dict[str, Any], filename: str) -> dict[str, Any] | None:
-    for item in manifest.get("artifacts", []):
-        if item.get("filename") == filename:
-            return item
-    return None
+def _artifact_index(manifest: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Filename-keyed view of the manifest artifacts, so repeated lookups are
+    O(1) instead of rescanning the list per artifact."""
+    return {item["filename"]: item for item in manifest.get("artifacts", []) if "filename" in item}
 
 
 def download_for_record(
@@ -348,45 +481,63 @@ def download_for_record(
     retry_count: int,
     rate_limit_sec: float,
     compute_sha256: bool,
+    session: requests.Session | None = None,
+    manifest_cache: ManifestCache | None = None,
+    progress: tqdm | None = None,
 ) -> dict[str, Any]:
-    manifest = _read_manifest(manifest_path, record)
+    # A caller-supplied session is reused for the DataLink query and all
+    # artifact downloads, so keepalive connections survive across records
+    # instead of paying a TCP+TLS handshake per MOUS.
+    if session is None:
+        session = requests.Session()
+        session.headers.update({"User-Agent": user_agent})
+    if manifest_cache is not None:
+        manifest = manifest_cache.read(manifest_path, record)
+    else:
+        manifest = _read_manifest(manifest_path, record)
+    by_fn = _artifact_index(manifest)
     selected_kinds = resolve_artifact_selection(artifacts_spec)
     available = fetch_datalink_artifacts(
         datalink_sync_url=datalink_sync_url,
         member_ous_uid=record.member_ous_uid,
         timeout_sec=timeout_sec,
         user_agent=user_agent,
+        session=session,
     )
 
+    # One timestamp per phase; now_utc_iso formats a datetime each call and
+    # the loops below would otherwise take it several times per artifact.
+    scan_ts = now_utc_iso()
     to_fetch: list[ArtifactInfo] = []
     for art in available:
         if not _artifact_selected(art.kind, selected_kinds):
             continue
         local_path = delivered_dir / art.filename
-        existing = _entry_lookup(manifest, art.filename)
-        if _artifact_exists(local_path, art.size_bytes) or _artifact_satisfied_without_archive_file(existing):
+        existing = by_fn.get(art.filename)
+        st = _stat_or_none(local_path)
+        if _artifact_exists(st, art.size_bytes) or _artifact_satisfied_without_archive_file(existing):
             if existing:
                 existing["status"] = "present"
-                existing["kind"] = _normalize_kind(art.kind)
-                if local_path.exists():
-                    existing["size_bytes"] = local_path.stat().st_size
-                existing["updated_at"] = now_utc_iso()
+                existing["kind"] = art.kind
+                if st is not None:
+                    existing["size_bytes"] = st.st_size
+                existing["updated_at"] = scan_ts
             else:
-                manifest["artifacts"].append(
-                    {
-                        "kind": _normalize_kind(art.kind),
-                        "filename": art.filename,
-                        "url": art.url,
-                        "local_path": str(local_path),
-                        "size_bytes": local_path.stat().st_size if local_path.exists() else None,
-                        "checksum": None,
-                        "status": "present",
-                        "downloaded_at": now_utc_iso(),
-                        "updated_at": now_utc_iso(),
-                        "semantics": art.semantics,
-                        "description": art.description,
-                    }
-                )
+                entry = {
+                    "kind": art.kind,
+                    "filename": art.filename,
+                    "url": art.url,
+                    "local_path": str(local_path),
+                    "size_bytes": st.st_size if st is not None else None,
+                    "checksum": None,
+                    "status": "present",
+                    "downloaded_at": scan_ts,
+                    "updated_at": scan_ts,
+                    "semantics": art.semantics,
+                    "description": art.description,
+                }
+                by_fn[art.filename] = entry
+                manifest["artifacts"].append(entry)
             continue
         to_fetch.append(art)
 
@@ -399,12 +550,12 @@ def download_for_record(
                 "selected_kinds": sorted(selected_kinds),
             }
         )
-        _save_manifest(manifest_path, manifest)
+        if manifest_cache is not None:
+            manifest_cache.mark_dirty(manifest_path)
+        else:
+            _save_manifest(manifest_path, manifest)
         return manifest
 
-    session = requests.Session()
-    session.headers.update({"User-Agent": user_agent})
-
     futures = {}
     with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
         for art in to_fetch:
@@ -417,24 +568,33 @@ def download_for_record(
                 timeout_sec=timeout_sec,
                 retry_count=retry_count,
                 rate_limit_sec=rate_limit_sec,
+                compute_sha256=compute_sha256,
             )
             futures[fut] = (art, path)
 
-        for fut in tqdm(as_completed(futures), total=len(futures), desc=f"{record.member_ous_uid}"):
+        # A driver-supplied aggregate bar avoids constructing and tearing down
+        # a tqdm instance (and its terminal IO) per record.
+        if progress is not None:
+            completed = as_completed(futures)
+        else:
+            completed = tqdm(as_completed(futures), total=len(futures), desc=f"{record.member_ous_uid}")
+        for fut in completed:
             art, local_path = futures[fut]
-            status, error, size_bytes = fut.result()
-            checksum = sha256_file(local_path) if (status == "ok" and compute_sha256) else None
-            existing = _entry_lookup(manifest, art.filename)
+            if progress is not None:
+                progress.update(1)
+            status, error, size_bytes, checksum = fut.result()
+            existing = by_fn.get(art.filename)
+            ts = now_utc_iso()
             payload = {
-                "kind": _normalize_kind(art.kind),
+                "kind": art.kind,
                 "filename": art.filename,
                 "url": art.url,
                 "local_path": str(local_path),
                 "size_bytes": size_bytes,
                 "checksum": checksum or art.checksum,
                 "status": "present" if status == "ok" else "error",
-                "downloaded_at": now_utc_iso() if status == "ok" else None,
-                "updated_at": now_utc_iso(),
+                "downloaded_at": ts if status == "ok" else None,
+                "updated_at": ts,
                 "error": error,
                 "semantics": art.semantics,
                 "description": art.description,
@@ -443,6 +603,7 @@ def download_for_record(
             if existing:
                 existing.update(payload)
             else:
+                by_fn[art.filename] = payload
                 manifest["artifacts"].append(payload)
 
     manifest.setdefault("history", []).append(
@@ -453,22 +614,30 @@ def download_for_record(
             "downloaded": len(to_fetch),
         }
     )
-    _save_manifest(manifest_path, manifest)
+    if manifest_cache is not None:
+        manifest_cache.mark_dirty(manifest_path)
+    else:
+        _save_manifest(manifest_path, manifest)
     return manifest
 
 
-def read_candidates_jsonl(path: Path) -> list[MousRecord]:
+def read_candidates_jsonl(path: Path) -> Iterator[MousRecord]:
+    """Yield candidate records one line at a time; large inputs never have to
+    fit in memory. Callers that need a list (sorting, sampling) materialize."""
     if path.suffix.lower() != ".jsonl":
-        return read_candidates_text(path)
-    out: list[MousRecord] = []
-    with path.open("r", encoding="utf-8") as handle:
+        yield from read_candidates_text(path)
+        return
+    # Binary iteration skips the TextIOWrapper decode; json.loads takes the
+    # UTF-8 bytes directly. Local bindings keep the per-line lookups flat.
+    loads = json.loads
+    record = MousRecord
+    with path.open("rb") as handle:
         for line in handle:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
-            row = json.loads(line)
-            out.append(
-                MousRecord(
+            row = loads(line)
+            yield (
+                record(
                     project_code=row["project_code"],
                     member_ous_uid=row["member_ous_uid"],
                     group_ous_uid=row.get("group_ous_uid"),
@@ -485,7 +654,6 @@ def read_candidates_jsonl(path: Path) -> list[MousRecord]:
                     archive_meta=row.get("archive_meta", {}),
                 )
             )
-    return out
 
 
 def write_candidates_jsonl(path: Path, rows: list[MousRecord], adql: str) -> None:
@@ -493,12 +661,15 @@ def write_candidates_jsonl(path: Path, rows: list[MousRecord], adql: str) -> Non
         write_candidates_text(path, rows, adql)
         return
     ensure_dir(path.parent)
-    with path.open("w", encoding="utf-8") as handle:
-        for row in rows:
-            payload = asdict(row)
-            payload["query_adql"] = adql
-            payload["query_timestamp"] = now_utc_iso()
-            handle.write(json.dumps(payload) + "\n")
+    # One encoder and one timestamp for the whole file; per-record json.dumps
+    # pays the encoder setup (and a clock read) every line.
+    encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+    timestamp = now_utc_iso()
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+        handle.writelines(
+            encode({**asdict(row), "query_adql": adql, "query_timestamp": timestamp}) + "\n"
+            for row in rows
+        )
 
 
 def _format_float(value: Any, ndigits: int = 3) -> str:
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import sqlite3
 from pathlib import Path
 from typing import Any
 
-from .utils import now_utc_iso
+from .utils import load_json, now_utc_iso
 
 LOGGER = logging.getLogger(__name__)
 
@@ -98,10 +99,29 @@ def connect_db(path: Path, readonly: bool = False) -> sqlite3.Connection:
             conn.execute("PRAGMA journal_mode = DELETE")
         except sqlite3.OperationalError:
             pass
+        # Cheap per-connection tuning that does not touch durability: sorts
+        # and temp indexes in memory, mmap'd reads, and a 200 MB page cache so
+        # bulk upserts stop thrashing the default 2 MB one.
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA cache_size = -200000")
+        # synchronous stays at SQLite's default (FULL): with nolock on shared
+        # filesystems and a rollback journal, relaxing it risks corruption on
+        # power loss. ALMA_SQLITE_SYNC lets local-disk runs opt into NORMAL.
+        sync = os.environ.get("ALMA_SQLITE_SYNC", "").upper()
+        if sync in {"NORMAL", "FULL", "EXTRA"}:
+            conn.execute(f"PRAGMA synchronous = {sync}")
     return conn
 
 
+# Bumped when the DDL below changes shape; init_db uses it to skip re-parsing
+# the schema script on databases that are already current.
+_SCHEMA_VERSION = 1
+
+
 def init_db(conn: sqlite3.Connection) -> None:
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+        return
     conn.executescript(
         """
         CREATE TABLE IF NOT EXISTS mous (
@@ -155,11 +175,134 @@ def init_db(conn: sqlite3.Connection) -> None:
         );
         """
     )
+    conn.executescript(_SECONDARY_INDEX_DDL)
+    conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
     conn.commit()
 
 
-def upsert_mous_from_summary(
-    conn: sqlite3.Connection,
+# Partial indexes over just the "true"/error rows: tiny on disk, and they let
+# stage filters and failure queries probe instead of scan. Kept separate from
+# the table DDL so bulk merges can drop and rebuild them around the load.
+_SECONDARY_INDEX_DDL = """
+    CREATE INDEX IF NOT EXISTS idx_mous_discovered ON mous(discovered) WHERE discovered=1;
+    CREATE INDEX IF NOT EXISTS idx_mous_downloaded ON mous(downloaded) WHERE downloaded=1;
+    CREATE INDEX IF NOT EXISTS idx_mous_unpacked ON mous(unpacked) WHERE unpacked=1;
+    CREATE INDEX IF NOT EXISTS idx_mous_summarized ON mous(summarized) WHERE summarized=1;
+    CREATE INDEX IF NOT EXISTS idx_artifact_error_kind ON artifact(status, kind) WHERE status='error';
+
+    ANALYZE;
+    """
+
+_SECONDARY_INDEX_NAMES = (
+    "idx_mous_discovered",
+    "idx_mous_downloaded",
+    "idx_mous_unpacked",
+    "idx_mous_summarized",
+    "idx_artifact_error_kind",
+)
+
+
+def drop_secondary_indexes(conn: sqlite3.Connection) -> None:
+    """Drop the partial indexes so a bulk load skips their B-tree upkeep."""
+    for name in _SECONDARY_INDEX_NAMES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def create_secondary_indexes(conn: sqlite3.Connection) -> None:
+    """Recreate the partial indexes (one pass over final data) and re-ANALYZE."""
+    conn.executescript(_SECONDARY_INDEX_DDL)
+
+
+_MOUS_UPSERT_SQL = """
+    INSERT INTO mous (
+        mous_uid, project_code, release_date, obs_date, band_json,
+        qa2_status, qa0_status, qa2_reasons_json, qa0_reasons_json,
+        dr_intervention_suspected, dr_flag_commands_count, dr_manual_flag_commands_count, asa_qa_present,
+        local_dir, manifest_path, summary_path,
+        discovered, downloaded, unpacked, summarized, indexed,
+        last_error_stage, last_error_message, shard_id, last_seen, last_updated
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(mous_uid) DO UPDATE SET
+        project_code=excluded.project_code,
+        release_date=excluded.release_date,
+        obs_date=excluded.obs_date,
+        band_json=excluded.band_json,
+        qa2_status=excluded.qa2_status,
+        qa0_status=excluded.qa0_status,
+        qa2_reasons_json=excluded.qa2_reasons_json,
+        qa0_reasons_json=excluded.qa0_reasons_json,
+        dr_intervention_suspected=excluded.dr_intervention_suspected,
+        dr_flag_commands_count=excluded.dr_flag_commands_count,
+        dr_manual_flag_commands_count=excluded.dr_manual_flag_commands_count,
+        asa_qa_present=excluded.asa_qa_present,
+        local_dir=excluded.local_dir,
+        manifest_path=excluded.manifest_path,
+        summary_path=excluded.summary_path,
+        discovered=excluded.discovered,
+        downloaded=excluded.downloaded,
+        unpacked=excluded.unpacked,
+        summarized=excluded.summarized,
+        indexed=excluded.indexed,
+        last_error_stage=excluded.last_error_stage,
+        last_error_message=excluded.last_error_message,
+        shard_id=excluded.shard_id,
+        last_seen=excluded.last_seen,
+        last_updated=excluded.last_updated
+    """
+
+_ARTIFACT_UPSERT_SQL = """
+    INSERT INTO artifact (mous_uid, filename, kind, status, local_path, source_url, size_bytes, checksum, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(mous_uid, filename) DO UPDATE SET
+        kind=excluded.kind,
+        status=excluded.status,
+        local_path=excluded.local_path,
+        source_url=excluded.source_url,
+        size_bytes=excluded.size_bytes,
+        checksum=excluded.checksum,
+        updated_at=excluded.updated_at
+    """
+
+# eb rows carry no payload beyond their key, so a conflict needs no work at
+# all; DO NOTHING skips the delete-then-insert that INSERT OR REPLACE does.
+_EB_UPSERT_SQL = (
+    "INSERT INTO eb (mous_uid, eb_uid) VALUES (?, ?) "
+    "ON CONFLICT(mous_uid, eb_uid) DO NOTHING"
+)
+
+# Bind order of _MOUS_UPSERT_SQL; merge_db uses it to map source columns to
+# parameter positions without a dict per row.
+_MOUS_COLUMNS = (
+    "mous_uid",
+    "project_code",
+    "release_date",
+    "obs_date",
+    "band_json",
+    "qa2_status",
+    "qa0_status",
+    "qa2_reasons_json",
+    "qa0_reasons_json",
+    "dr_intervention_suspected",
+    "dr_flag_commands_count",
+    "dr_manual_flag_commands_count",
+    "asa_qa_present",
+    "local_dir",
+    "manifest_path",
+    "summary_path",
+    "discovered",
+    "downloaded",
+    "unpacked",
+    "summarized",
+    "indexed",
+    "last_error_stage",
+    "last_error_message",
+    "shard_id",
+    "last_seen",
+    "last_updated",
+)
+
+
+def _prepare_mous_rows(
     *,
     summary: dict[str, Any],
     manifest: dict[str, Any],
@@ -167,18 +310,27 @@ def upsert_mous_from_summary(
     shard_id: str | None,
     last_error_stage: str | None = None,
     last_error_message: str | None = None,
-) -> None:
+    now: str | None = None,
+) -> tuple[tuple, list[tuple], list[tuple]]:
+    """Build the (mous_row, eb_rows, artifact_rows) tuples for one MOUS.
+
+    ``now`` lets bulk callers stamp a whole run with one timestamp instead of
+    formatting a fresh one per row; single upserts leave it unset.
+    """
     mous = _summary_mous(summary)
     qa = _summary_qa(summary)
-    mous_uid = summary.get("mous_uid") or mous.get("mous_uid") or manifest.get("mous_uid")
+
+    def _first(key: str, manifest_key: str | None = None) -> Any:
+        """Summary -> mous block -> manifest precedence for one field."""
+        return summary.get(key) or mous.get(key) or manifest.get(manifest_key or key)
+
+    mous_uid = _first("mous_uid")
     if not mous_uid:
         raise ValueError("Missing mous_uid for upsert")
 
-    release_date = (
-        summary.get("public_release_date") or mous.get("public_release_date") or manifest.get("release_date")
-    )
-    obs_date = summary.get("obs_date") or mous.get("obs_date") or manifest.get("obs_date")
-    band_json = json.dumps(summary.get("band") or mous.get("band") or manifest.get("band_list") or [])
+    release_date = _first("public_release_date", "release_date")
+    obs_date = _first("obs_date")
+    band_json = json.dumps(_first("band", "band_list") or [])
     qa2_status = _qa_status_text(summary.get("qa2_status") or qa.get("qa2_status"))
     if qa2_status is None:
         qa2_status = _qa_status_text(manifest.get("qa2_status"))
@@ -203,7 +355,8 @@ def upsert_mous_from_summary(
     unpacked = 1 if manifest.get("unpacked") else 0
     summarized = 1 if summary else 0
     discovered = 1
-    now = now_utc_iso()
+    if now is None:
+        now = now_utc_iso()
 
     if not last_error_stage or not last_error_message:
         for art in artifacts:
@@ -212,189 +365,231 @@ def upsert_mous_from_summary(
                 last_error_message = art.get("error") or "artifact download failed"
                 break
 
-    conn.execute(
-        """
-        INSERT INTO mous (
-            mous_uid, project_code, release_date, obs_date, band_json,
-            qa2_status, qa0_status, qa2_reasons_json, qa0_reasons_json,
-            dr_intervention_suspected, dr_flag_commands_count, dr_manual_flag_commands_count, asa_qa_present,
-            local_dir, manifest_path, summary_path,
-            discovered, downloaded, unpacked, summarized, indexed,
-            last_error_stage, last_error_message, shard_id, last_seen, last_updated
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(mous_uid) DO UPDATE SET
-            project_code=excluded.project_code,
-            release_date=excluded.release_date,
-            obs_date=excluded.obs_date,
-            band_json=excluded.band_json,
-            qa2_status=excluded.qa2_status,
-            qa0_status=excluded.qa0_status,
-            qa2_reasons_json=excluded.qa2_reasons_json,
-            qa0_reasons_json=excluded.qa0_reasons_json,
-            dr_intervention_suspected=excluded.dr_intervention_suspected,
-            dr_flag_commands_count=excluded.dr_flag_commands_count,
-            dr_manual_flag_commands_count=excluded.dr_manual_flag_commands_count,
-            asa_qa_present=excluded.asa_qa_present,
-            local_dir=excluded.local_dir,
-            manifest_path=excluded.manifest_path,
-            summary_path=excluded.summary_path,
-            discovered=excluded.discovered,
-            downloaded=excluded.downloaded,
-            unpacked=excluded.unpacked,
-            summarized=excluded.summarized,
-            indexed=excluded.indexed,
-            last_error_stage=excluded.last_error_stage,
-            last_error_message=excluded.last_error_message,
-            shard_id=excluded.shard_id,
-            last_seen=excluded.last_seen,
-            last_updated=excluded.last_updated
-        """,
+    mous_row = (
+        mous_uid,
+        _first("project_code"),
+        release_date,
+        obs_date,
+        band_json,
+        qa2_status,
+        qa0_status,
+        qa2_reasons,
+        qa0_reasons,
+        dr_intervention,
+        dr_flags,
+        dr_manual,
+        asa_qa_present,
+        local_dir,
+        manifest.get("manifest_path"),
+        summary.get("summary_path"),
+        discovered,
+        downloaded,
+        unpacked,
+        summarized,
+        1,
+        last_error_stage,
+        last_error_message,
+        shard_id,
+        now,
+        now,
+    )
+    eb_rows = [(mous_uid, eb) for eb in _summary_eb_uids(summary, manifest)]
+    # Manifests reprocessed across runs can repeat a filename; dedupe before
+    # binding so each name costs one upsert. The last duplicate wins, which is
+    # what the repeated upserts converged to anyway.
+    unique_artifacts = {art.get("filename"): art for art in artifacts}
+    artifact_rows = [
         (
             mous_uid,
-            summary.get("project_code") or mous.get("project_code") or manifest.get("project_code"),
-            release_date,
-            obs_date,
-            band_json,
-            qa2_status,
-            qa0_status,
-            qa2_reasons,
-            qa0_reasons,
-            dr_intervention,
-            dr_flags,
-            dr_manual,
-            asa_qa_present,
-            local_dir,
-            manifest.get("manifest_path"),
-            summary.get("summary_path"),
-            discovered,
-            downloaded,
-            unpacked,
-            summarized,
-            1,
-            last_error_stage,
-            last_error_message,
-            shard_id,
-            now,
+            filename,
+            art.get("kind"),
+            art.get("status"),
+            art.get("local_path"),
+            art.get("url"),
+            art.get("size_bytes"),
+            art.get("checksum"),
             now,
-        ),
-    )
-
-    eb_uids = _summary_eb_uids(summary, manifest)
-    for eb in eb_uids:
-        conn.execute(
-            "INSERT OR REPLACE INTO eb (mous_uid, eb_uid) VALUES (?, ?)",
-            (mous_uid, eb),
         )
-
-    for art in artifacts:
-        conn.execute(
-            """
-            INSERT INTO artifact (mous_uid, filename, kind, status, local_path, source_url, size_bytes, checksum, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(mous_uid, filename) DO UPDATE SET
-                kind=excluded.kind,
-                status=excluded.status,
-                local_path=excluded.local_path,
-                source_url=excluded.source_url,
-                size_bytes=excluded.size_bytes,
-                checksum=excluded.checksum,
-                updated_at=excluded.updated_at
-            """,
-            (
-                mous_uid,
-                art.get("filename"),
-                art.get("kind"),
-                art.get("status"),
-                art.get("local_path"),
-                art.get("url"),
-                art.get("size_bytes"),
-                art.get("checksum"),
-                now,
-            ),
-        )
-    conn.commit()
+        for filename, art in unique_artifacts.items()
+    ]
+    return mous_row, eb_rows, artifact_rows
 
 
-def ingest_summary_file(
+def upsert_mous_from_summary(
     conn: sqlite3.Connection,
     *,
-    summary_path: Path,
-    manifest_path: Path,
+    summary: dict[str, Any],
+    manifest: dict[str, Any],
+    local_dir: str,
     shard_id: str | None,
+    last_error_stage: str | None = None,
+    last_error_message: str | None = None,
+    now: str | None = None,
+    commit: bool = True,
 ) -> None:
-    summary = json.loads(summary_path.read_text(encoding="utf-8")) if summary_path.exists() else {}
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+    mous_row, eb_rows, artifact_rows = _prepare_mous_rows(
+        summary=summary,
+        manifest=manifest,
+        local_dir=local_dir,
+        shard_id=shard_id,
+        last_error_stage=last_error_stage,
+        last_error_message=last_error_message,
+        now=now,
+    )
+    conn.execute(_MOUS_UPSERT_SQL, mous_row)
+    if eb_rows:
+        conn.executemany(_EB_UPSERT_SQL, eb_rows)
+    if artifact_rows:
+        conn.executemany(_ARTIFACT_UPSERT_SQL, artifact_rows)
+    if commit:
+        conn.commit()
+
+
+def upsert_mous_batch(conn: sqlite3.Connection, items: list[dict[str, Any]], commit: bool = True) -> None:
+    """Upsert many MOUS in one executemany pass per table.
+
+    Each item is a kwargs dict for :func:`_prepare_mous_rows` (summary,
+    manifest, local_dir, shard_id, optional last_error_*). One statement per
+    table instead of one per row is the cheap half of bulk loading; the
+    transaction batching around it is the caller's job.
+    """
+    mous_rows: list[tuple] = []
+    eb_rows: list[tuple] = []
+    artifact_rows: list[tuple] = []
+    for item in items:
+        row, ebs, arts = _prepare_mous_rows(**item)
+        mous_rows.append(row)
+        eb_rows.extend(ebs)
+        artifact_rows.extend(arts)
+    if mous_rows:
+        conn.executemany(_MOUS_UPSERT_SQL, mous_rows)
+    if eb_rows:
+        conn.executemany(_EB_UPSERT_SQL, eb_rows)
+    if artifact_rows:
+        conn.executemany(_ARTIFACT_UPSERT_SQL, artifact_rows)
+    if commit:
+        conn.commit()
+
+
+def load_summary_pair(
+    summary_path: Path, manifest_path: Path
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Read and validate the (summary, manifest) JSON pair for one MOUS."""
+    # load_json reads bytes straight into json.loads and folds the missing-file
+    # stat into the read, so each pair costs two syscalls instead of four.
+    summary = load_json(summary_path, default={})
+    manifest = load_json(manifest_path, default={})
     summary.setdefault("summary_path", str(summary_path))
     manifest.setdefault("manifest_path", str(manifest_path))
     if not (summary.get("mous_uid") or manifest.get("mous_uid")):
         raise ValueError(f"Missing mous_uid in {summary_path} and {manifest_path}")
+    return summary, manifest
+
+
+def ingest_summary_file(
+    conn: sqlite3.Connection,
+    *,
+    summary_path: Path,
+    manifest_path: Path,
+    shard_id: str | None,
+    now: str | None = None,
+    commit: bool = True,
+) -> None:
+    summary, manifest = load_summary_pair(summary_path, manifest_path)
     upsert_mous_from_summary(
         conn,
         summary=summary,
         manifest=manifest,
         local_dir=str(summary_path.parent),
         shard_id=shard_id,
+        now=now,
+        commit=commit,
     )
 
 
-def merge_db(source: sqlite3.Connection, target: sqlite3.Connection) -> None:
-    init_db(target)
-    cur = source.execute("SELECT * FROM mous")
-    mous_rows = cur.fetchall()
-    mous_cols = [d[0] for d in cur.description]
+# How many source rows merge_db pulls per fetchmany; bounds the peak memory a
+# large shard needs while keeping executemany batches big enough to matter.
+_MERGE_FETCH_BATCH = 10000
 
-    for row in mous_rows:
-        item = dict(zip(mous_cols, row))
-        target.execute(
-            """
-            INSERT INTO mous (
-                mous_uid, project_code, release_date, obs_date, band_json,
-                qa2_status, qa0_status, qa2_reasons_json, qa0_reasons_json,
-                dr_intervention_suspected, dr_flag_commands_count, dr_manual_flag_commands_count, asa_qa_present,
-                local_dir, manifest_path, summary_path,
-                discovered, downloaded, unpacked, summarized, indexed,
-                last_error_stage, last_error_message, shard_id, last_seen, last_updated
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(mous_uid) DO UPDATE SET
-                project_code=excluded.project_code,
-                release_date=excluded.release_date,
-                obs_date=excluded.obs_date,
-                band_json=excluded.band_json,
-                qa2_status=excluded.qa2_status,
-                qa0_status=excluded.qa0_status,
-                qa2_reasons_json=excluded.qa2_reasons_json,
-                qa0_reasons_json=excluded.qa0_reasons_json,
-                dr_intervention_suspected=excluded.dr_intervention_suspected,
-                dr_flag_commands_count=excluded.dr_flag_commands_count,
-                dr_manual_flag_commands_count=excluded.dr_manual_flag_commands_count,
-                asa_qa_present=excluded.asa_qa_present,
-                local_dir=excluded.local_dir,
-                manifest_path=excluded.manifest_path,
-                summary_path=excluded.summary_path,
-                discovered=excluded.discovered,
-                downloaded=excluded.downloaded,
-                unpacked=excluded.unpacked,
-                summarized=excluded.summarized,
-                indexed=excluded.indexed,
-                last_error_stage=excluded.last_error_stage,
-                last_error_message=excluded.last_error_message,
-                shard_id=excluded.shard_id,
-                last_seen=excluded.last_seen,
-                last_updated=excluded.last_updated
-            """,
-            tuple(item.get(k) for k in mous_cols),
-        )
+
+def merge_db(source: sqlite3.Connection, target: sqlite3.Connection, commit: bool = True) -> None:
+    init_db(target)
+    # Selecting the bind order explicitly hands sqlite3's raw row tuples
+    # straight to executemany — no per-row reordering in Python at all. Shards
+    # from older schema revisions fall back to positional remapping. Rows are
+    # streamed with fetchmany so a large shard is never held in memory whole.
+    try:
+        cur = source.execute(f"SELECT {', '.join(_MOUS_COLUMNS)} FROM mous")
+        remap = None
+    except sqlite3.OperationalError:
+        cur = source.execute("SELECT * FROM mous")
+        mous_cols = [d[0] for d in cur.description]
+        remap = [mous_cols.index(col) if col in mous_cols else None for col in _MOUS_COLUMNS]
+    while True:
+        batch = cur.fetchmany(_MERGE_FETCH_BATCH)
+        if not batch:
+            break
+        if remap is not None:
+            batch = [tuple(row[i] if i is not None else None for i in remap) for row in batch]
+        target.executemany(_MOUS_UPSERT_SQL, batch)
 
     for table in ("eb", "artifact"):
         cur = source.execute(f"SELECT * FROM {table}")
-        rows = cur.fetchall()
         cols = [d[0] for d in cur.description]
         placeholders = ",".join("?" for _ in cols)
-        target.executemany(
-            f"INSERT OR REPLACE INTO {table} ({','.join(cols)}) VALUES ({placeholders})",
-            rows,
-        )
+        sql = f"INSERT OR REPLACE INTO {table} ({','.join(cols)}) VALUES ({placeholders})"
+        while True:
+            batch = cur.fetchmany(_MERGE_FETCH_BATCH)
+            if not batch:
+                break
+            target.executemany(sql, batch)
+    if commit:
+        target.commit()
+
+
+_MOUS_ATTACH_MERGE_SQL = (
+    f"INSERT INTO mous ({', '.join(_MOUS_COLUMNS)}) "
+    f"SELECT {', '.join(_MOUS_COLUMNS)} FROM src.mous WHERE true "
+    "ON CONFLICT(mous_uid) DO UPDATE SET "
+    + ", ".join(f"{col}=excluded.{col}" for col in _MOUS_COLUMNS[1:])
+)
+
+
+def merge_attached_db(target: sqlite3.Connection, db_path: Path) -> None:
+    """Merge one shard database by ATTACHing it and copying inside SQLite.
+
+    Three INSERT..SELECT statements replace the per-row Python round trips of
+    :func:`merge_db`; SQLite moves the rows internally. ATTACH is not allowed
+    inside a transaction, so pending target work is committed first and the
+    merge commits its own transaction before detaching. Raises
+    ``sqlite3.OperationalError`` if the shard schema does not line up; callers
+    fall back to the row-by-row merge.
+    """
+    init_db(target)
     target.commit()
+    target.execute(
+        "ATTACH DATABASE ? AS src", (f"file:{db_path.absolute()}?mode=ro&immutable=1",)
+    )
+    try:
+        target.execute(_MOUS_ATTACH_MERGE_SQL)
+        target.execute(
+            "INSERT INTO eb (mous_uid, eb_uid) SELECT mous_uid, eb_uid FROM src.eb WHERE true "
+            "ON CONFLICT(mous_uid, eb_uid) DO NOTHING"
+        )
+        target.execute(
+            """
+            INSERT OR REPLACE INTO artifact
+                (mous_uid, filename, kind, status, local_path, source_url, size_bytes, checksum, updated_at)
+            SELECT mous_uid, filename, kind, status, local_path, source_url, size_bytes, checksum, updated_at
+            FROM src.artifact
+            """
+        )
+        target.commit()
+    except Exception:
+        target.rollback()
+        raise
+    finally:
+        target.execute("DETACH DATABASE src")
 
 
 def integrity_check(conn: sqlite3.Connection) -> str:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from .models import MousRecord
 from .utils import ensure_dir, uid_to_path_segment
@@ -35,16 +37,47 @@ def _legacy_build_mous_dir(dest_root: Path, record: MousRecord) -> Path:
     return dest_root / science / group / member
 
 
+@functools.lru_cache(maxsize=256)
+def _project_member_dirs(project_root: str, _mtime_ns: int) -> dict[str, str]:
+    """Map member-dir names to paths under one project root.
+
+    One pair of nested scandirs per project per process replaces a
+    ``glob("*/*/<member>")`` fanout per record. Keyed on the project root's
+    mtime so a reshuffled tree invalidates; dirs the pipeline itself creates
+    mid-run are found earlier via the preferred-path exists() check, not here.
+    """
+    found: list[tuple[str, str]] = []
+    try:
+        with os.scandir(project_root) as science_scan:
+            science_dirs = [e.path for e in science_scan if e.is_dir(follow_symlinks=True)]
+    except OSError:
+        return {}
+    for science_dir in science_dirs:
+        try:
+            with os.scandir(science_dir) as group_scan:
+                group_dirs = [e.path for e in group_scan if e.is_dir(follow_symlinks=True)]
+            for group_dir in group_dirs:
+                with os.scandir(group_dir) as member_scan:
+                    found.extend(
+                        (e.name, e.path) for e in member_scan if e.is_dir(follow_symlinks=True)
+                    )
+        except OSError:
+            continue
+    members: dict[str, str] = {}
+    # Sorted by path so duplicates keep the first match, like the old glob.
+    for name, path in sorted(found, key=lambda item: item[1]):
+        members.setdefault(name, path)
+    return members
+
+
 def _find_existing_project_member_dir(dest_root: Path, project: str, member: str) -> Path | None:
     project_root = dest_root / project
-    if not project_root.exists():
+    try:
+        st = os.stat(project_root)
+    except OSError:
         return None
-    matches = sorted(
-        path
-        for path in project_root.glob(f"*/*/{member}")
-        if path.is_dir()
-    )
-    return matches[0] if matches else None
+    path = _project_member_dirs(str(project_root), st.st_mtime_ns).get(member)
+    return Path(path) if path else None
 
 
 def build_mous_dir(dest_root: Path, record: MousRecord) -> Path:
@@ -90,17 +123,56 @@ def ensure_mous_layout(dest_root: Path, record: MousRecord) -> dict[str, Path]:
 
 
 def find_mous_dirs(root: Path) -> list[Path]:
-    result: list[Path] = []
-    for path in root.rglob("*"):
-        if not path.is_dir():
+    # One scandir walk instead of rglob("*") plus two exists() probes per
+    # directory; iter_mous_entries spots the manifest/summary names while it
+    # is already listing each directory.
+    return sorted({mous_dir for mous_dir, _manifest, _summary in iter_mous_entries(root)})
+
+
+def iter_mous_entries(
+    root: Path,
+) -> Iterator[tuple[Path, os.DirEntry | None, os.DirEntry | None]]:
+    """Yield ``(mous_dir, manifest_entry, summary_entry)`` for candidate MOUS dirs.
+
+    Matches the same directories as :func:`find_mous_dirs` but walks the tree
+    with ``os.scandir``, so callers get ``os.DirEntry`` objects (with cached
+    stat results) for the manifest/summary files instead of paying an extra
+    ``exists()`` stat per directory. Entries are ``None`` when the file is
+    absent.
+    """
+    stack: list[Path | os.DirEntry] = [root]
+    while stack:
+        current = stack.pop()
+        subdirs: list[os.DirEntry] = []
+        manifest_entry: os.DirEntry | None = None
+        summary_entry: os.DirEntry | None = None
+        try:
+            with os.scandir(current) as scan:
+                for entry in scan:
+                    # follow_symlinks=False reads the type straight from the
+                    # listing (no stat) and, like the rglob this replaced,
+                    # never descends into symlinked dirs — weblogs contain
+                    # them, and a cycle would otherwise re-walk the tree.
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry)
+                    elif entry.name == MANIFEST_FILENAME:
+                        manifest_entry = entry
+                    elif entry.name == SUMMARY_FILENAME:
+                        summary_entry = entry
+        except OSError:
             continue
-        name = path.name
-        if name.startswith("member.uid___") or name.startswith("member_uid___"):
-            result.append(path)
+        # Reverse-sorted so the stack pops subdirectories in name order.
+        stack.extend(sorted(subdirs, key=lambda e: e.name, reverse=True))
+        if current is root:
             continue
-        if (path / MANIFEST_FILENAME).exists() or (path / SUMMARY_FILENAME).exists():
-            result.append(path)
-    return sorted(set(result))
+        name = current.name
+        if (
+            name.startswith("member.uid___")
+            or name.startswith("member_uid___")
+            or manifest_entry is not None
+            or summary_entry is not None
+        ):
+            yield Path(current), manifest_entry, summary_entry
 
 
 def ensure_layout_for_existing_mous(mous_dirs: Iterable[Path], fix_layout: bool) -> None:
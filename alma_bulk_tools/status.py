@@ -3,30 +3,33 @@ from __future__ import annotations
 import json
 import sqlite3
 from collections import Counter
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 
-def _bin_month(date_str: str | None) -> str:
-    if not date_str:
-        return "unknown"
-    try:
-        dt = datetime.fromisoformat(date_str.replace("Z", ""))
-        return dt.strftime("%Y-%m")
-    except ValueError:
-        if len(date_str) >= 7:
-            return date_str[:7]
-        return "unknown"
-
-
 def build_status_report(conn: sqlite3.Connection, top_n_errors: int = 10) -> dict[str, Any]:
-    counts = {}
-    counts["discovered"] = conn.execute("SELECT COUNT(*) FROM mous WHERE discovered=1").fetchone()[0]
-    counts["downloaded"] = conn.execute("SELECT COUNT(*) FROM mous WHERE downloaded=1").fetchone()[0]
-    counts["unpacked"] = conn.execute("SELECT COUNT(*) FROM mous WHERE unpacked=1").fetchone()[0]
-    counts["summarized"] = conn.execute("SELECT COUNT(*) FROM mous WHERE summarized=1").fetchone()[0]
-    counts["indexed"] = conn.execute("SELECT COUNT(*) FROM mous WHERE indexed=1").fetchone()[0]
+    # One pass over mous covers the five stage counts and the two mous-side
+    # todo figures; each separate COUNT(*) was its own full table scan.
+    stage_row = conn.execute(
+        """
+        SELECT
+            COALESCE(SUM(discovered=1), 0),
+            COALESCE(SUM(downloaded=1), 0),
+            COALESCE(SUM(unpacked=1), 0),
+            COALESCE(SUM(summarized=1), 0),
+            COALESCE(SUM(indexed=1), 0),
+            COALESCE(SUM(summarized=1 AND COALESCE(asa_qa_present, 0)=0), 0),
+            COALESCE(SUM(summarized=0), 0)
+        FROM mous
+        """
+    ).fetchone()
+    counts = {
+        "discovered": stage_row[0],
+        "downloaded": stage_row[1],
+        "unpacked": stage_row[2],
+        "summarized": stage_row[3],
+        "indexed": stage_row[4],
+    }
 
     fail_rows = conn.execute(
         "SELECT COALESCE(last_error_stage, 'none') AS stage, COALESCE(last_error_message, '') AS msg FROM mous"
@@ -34,35 +37,66 @@ def build_status_report(conn: sqlite3.Connection, top_n_errors: int = 10) -> dic
     by_stage = Counter(row[0] for row in fail_rows if row[0] != "none")
     msg_counts = Counter(row[1] for row in fail_rows if row[1])
 
-    bands = Counter()
-    for row in conn.execute("SELECT band_json FROM mous").fetchall():
-        band_json = row[0] or "[]"
-        try:
-            items = json.loads(band_json)
-        except json.JSONDecodeError:
-            items = []
-        if not items:
-            bands["unknown"] += 1
-            continue
-        for b in items:
-            bands[str(b)] += 1
-
-    date_bins = Counter(_bin_month(r[0]) for r in conn.execute("SELECT release_date FROM mous").fetchall())
+    # Aggregate bands and release months inside SQLite; pulling every row into
+    # Python for json.loads/Counter pays a per-row crossing the query avoids.
+    try:
+        bands = Counter(
+            {
+                str(band): count
+                for band, count in conn.execute(
+                    """
+                    SELECT COALESCE(je.value, 'unknown') AS band, COUNT(*)
+                    FROM mous LEFT JOIN json_each(COALESCE(mous.band_json, '[]')) je
+                    GROUP BY band
+                    """
+                )
+            }
+        )
+    except sqlite3.OperationalError:
+        # json1 not compiled in (or malformed band_json): old row-by-row path.
+        bands = Counter()
+        for row in conn.execute("SELECT band_json FROM mous"):
+            try:
+                items = json.loads(row[0] or "[]")
+            except json.JSONDecodeError:
+                items = []
+            if items:
+                # Counter.update runs the tally in C instead of += per band.
+                bands.update(str(b) for b in items)
+            else:
+                bands["unknown"] += 1
+
+    date_bins = Counter(
+        {
+            month: count
+            for month, count in conn.execute(
+                """
+                SELECT
+                    CASE
+                        WHEN release_date IS NULL OR length(release_date) < 7 THEN 'unknown'
+                        ELSE substr(release_date, 1, 7)
+                    END AS month,
+                    COUNT(*)
+                FROM mous
+                GROUP BY month
+                """
+            )
+        }
+    )
 
+    artifact_row = conn.execute(
+        """
+        SELECT
+            COALESCE(SUM(status='error'), 0),
+            COALESCE(SUM(status='error' AND kind='auxiliary'), 0)
+        FROM artifact
+        """
+    ).fetchone()
     todo = {
-        "missing_qa": conn.execute(
-            """
-            SELECT COUNT(*) FROM mous
-            WHERE summarized=1 AND COALESCE(asa_qa_present, 0)=0
-            """
-        ).fetchone()[0],
-        "missing_summary": conn.execute("SELECT COUNT(*) FROM mous WHERE summarized=0").fetchone()[0],
-        "failed_downloads": conn.execute(
-            "SELECT COUNT(*) FROM artifact WHERE status='error'"
-        ).fetchone()[0],
-        "failed_auxiliary_downloads": conn.execute(
-            "SELECT COUNT(*) FROM artifact WHERE status='error' AND kind='auxiliary'"
-        ).fetchone()[0],
+        "missing_qa": stage_row[5],
+        "missing_summary": stage_row[6],
+        "failed_downloads": artifact_row[0],
+        "failed_auxiliary_downloads": artifact_row[1],
     }
 
     return {
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
+import heapq
 import logging
+import os
 import re
 import xml.etree.ElementTree as ET
-from collections import Counter, defaultdict
+from collections import defaultdict, deque
 from pathlib import Path
 from typing import Any
 
@@ -15,18 +18,44 @@ EB_UID_SEGMENT_RE = re.compile(
     r"uid___A002_X[0-9A-Za-z]+_X[0-9A-Za-z]+(?![0-9A-Za-z_])", re.IGNORECASE
 )
 EB_UID_URI_RE = re.compile(r"uid://A002/X[0-9A-Za-z]+/X[0-9A-Za-z]+(?![0-9A-Za-z_])")
+# Both spellings of an EB uid in one alternation so each path string gets a
+# single regex pass instead of a substring probe plus two findall scans.
+_EB_UID_COMBINED_RE = re.compile(
+    r"(?P<uri>uid://A002/X[0-9A-Za-z]+/X[0-9A-Za-z]+(?![0-9A-Za-z_]))"
+    r"|(?P<seg>uid___A002_X[0-9A-Za-z]+_X[0-9A-Za-z]+(?![0-9A-Za-z_]))",
+    re.IGNORECASE,
+)
+# Comment lines that look like flag rationale; one case-insensitive search
+# beats lowercasing each comment and probing a fresh keyword list per line.
+_REASON_KW_RE = re.compile(r"reason|flag|rfi|bad|manual", re.IGNORECASE)
+_WEBLOG_LANDING_NAMES = frozenset({"index.html", "t1-1.html"})
 
 
 def _iter_files(root: Path) -> list[Path]:
-    if not root.exists():
-        return []
-    return [p for p in root.rglob("*") if p.is_file()]
+    # os.scandir reads the file type along with the directory listing, so
+    # classifying each entry costs no extra stat; rglob("*") + is_file()
+    # paid one per entry and allocated a Path for every directory too.
+    out: list[Path] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as scan:
+                for entry in scan:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        out.append(Path(entry.path))
+        except OSError:
+            continue
+    return out
 
 
+@functools.lru_cache(maxsize=256)
 def _tag_local(tag: str) -> str:
-    if "}" in tag:
-        return tag.rsplit("}", 1)[1]
-    return tag
+    # Called once per element; a document repeats the same few tag strings,
+    # so cache hits skip even the single rpartition call.
+    _, sep, local = tag.rpartition("}")
+    return local if sep else tag
 
 
 def _uid_segment_to_uri(segment: str) -> str | None:
@@ -48,36 +77,45 @@ def _extract_eb_uids_from_text(values: list[str]) -> set[str]:
     for value in values:
         if not value:
             continue
-        if "uid://A002/" in value:
-            for token in EB_UID_URI_RE.findall(value):
-                out.add(token)
-        for match in EB_UID_SEGMENT_RE.findall(value):
-            uid = _uid_segment_to_uri(match)
-            if uid:
-                out.add(uid)
+        for match in _EB_UID_COMBINED_RE.finditer(value):
+            if match.lastgroup == "uri":
+                out.add(match.group("uri"))
+            else:
+                uid = _uid_segment_to_uri(match.group("seg"))
+                if uid:
+                    out.add(uid)
     return out
 
 
 def find_run_artifacts(run_dir: Path) -> dict[str, list[str]]:
-    paths = _iter_files(run_dir)
+    return _classify_paths(run_dir, _iter_files(run_dir))
+
+
+def _classify_paths(run_dir: Path, paths: list[Path]) -> dict[str, list[str]]:
+    """Bucket an already-listed file set; lets callers walk the tree once."""
     out: dict[str, list[str]] = defaultdict(list)
     for path in paths:
+        path_str = str(path)
         name = path.name.lower()
-        rel_parts = [part.lower() for part in path.relative_to(run_dir).parts]
+        # The name-based buckets are mutually exclusive, so one elif chain
+        # replaces a run of independent endswith/in probes per file.
         if name == "pipeline_aquareport.xml":
-            out["pipeline_aquareport_xml"].append(str(path))
-        if name == "applycalqa_outliers.txt":
-            out["applycalqa_outliers"].append(str(path))
-        if "flagtemplate" in name and name.endswith(".txt"):
-            out["flag_templates"].append(str(path))
-        if name.endswith(".pprequest.xml"):
-            out["pprequest_xml"].append(str(path))
+            out["pipeline_aquareport_xml"].append(path_str)
+        elif name == "applycalqa_outliers.txt":
+            out["applycalqa_outliers"].append(path_str)
+        elif name.endswith(".pprequest.xml"):
+            out["pprequest_xml"].append(path_str)
+        elif name.endswith(".txt") and "flagtemplate" in name:
+            out["flag_templates"].append(path_str)
+        elif name.endswith((".qa0_report.pdf", ".qa2_report.pdf")):
+            out["qa_report_files"].append(path_str)
+        # The directory-based buckets can overlap the name-based ones; one
+        # lowercased frozenset serves both membership tests.
+        rel_parts = frozenset(part.lower() for part in path.relative_to(run_dir).parts)
         if "qa" in rel_parts:
-            out["qa_files"].append(str(path))
-        if name.endswith(".qa0_report.pdf") or name.endswith(".qa2_report.pdf"):
-            out["qa_report_files"].append(str(path))
-        if "html" in rel_parts and name in {"index.html", "t1-1.html"}:
-            out["weblog_landing_candidates"].append(str(path))
+            out["qa_files"].append(path_str)
+        if "html" in rel_parts and name in _WEBLOG_LANDING_NAMES:
+            out["weblog_landing_candidates"].append(path_str)
     return dict(out)
 
 
@@ -100,11 +138,13 @@ def _choose_weblog_landing(candidates: list[str]) -> str | None:
 
 
 def parse_aqua_report(xml_path: Path) -> dict[str, Any]:
-    root = ET.fromstring(xml_path.read_bytes())
+    # iterparse hands each element over as its end tag arrives and clear()
+    # releases its text/attribs/children straight after, so a large AQUA
+    # report keeps an O(1) live set instead of the whole tree.
     topics = []
     stages = []
 
-    for elem in root.iter():
+    for _event, elem in ET.iterparse(xml_path, events=("end",)):
         name = _tag_local(elem.tag).lower()
         if "qapertopic" in name:
             topic = {
@@ -125,6 +165,7 @@ def parse_aqua_report(xml_path: Path) -> dict[str, Any]:
                     "reason": elem.attrib.get("Reason") or elem.attrib.get("reason"),
                 }
             )
+        elem.clear()
 
     qa_reasons = [
         t["reason"]
@@ -139,40 +180,53 @@ def parse_aqua_report(xml_path: Path) -> dict[str, Any]:
 
 
 _REASON_RE = re.compile(r"(?:reason|comment)\s*=\s*['\"]([^'\"]+)['\"]", re.IGNORECASE)
+_MANUAL_MODE_RE = re.compile(r"mode\s*=\s*['\"]manual['\"]", re.IGNORECASE)
+
+
+def _top_reasons(counts: dict[str, int], n: int = 20) -> list[dict[str, Any]]:
+    """Top-n reason rows, same ordering Counter.most_common gave."""
+    top = heapq.nlargest(n, counts.items(), key=lambda item: item[1])
+    return [{"reason": reason, "count": count} for reason, count in top]
 
 
 def parse_flag_template(path: Path) -> dict[str, Any]:
     commands = 0
     manual_commands = 0
-    reasons: Counter[str] = Counter()
-    recent_comments: list[str] = []
-
-    for raw_line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
-        if line.startswith("#"):
-            c = line.lstrip("#").strip()
-            if c:
-                recent_comments.append(c)
-                if len(recent_comments) > 3:
-                    recent_comments = recent_comments[-3:]
-            continue
+    # A plain dict with get() skips Counter's __missing__ dispatch on the
+    # per-line increments; only the final top-20 needs ranking.
+    reasons: dict[str, int] = {}
+    # maxlen evicts the oldest comment in place; the list version re-sliced
+    # itself on every comment past the third.
+    recent_comments: deque[str] = deque(maxlen=3)
+
+    # Iterating the open handle streams one buffered line at a time;
+    # read_text + splitlines held the whole file plus a list of every line.
+    with path.open("r", encoding="utf-8", errors="ignore") as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not line:
+                continue
+            if line.startswith("#"):
+                c = line.lstrip("#").strip()
+                if c:
+                    recent_comments.append(c)
+                continue
 
-        commands += 1
-        line_lower = line.lower()
-        is_manual = "mode='manual'" in line_lower or 'mode="manual"' in line_lower
-        if is_manual:
-            manual_commands += 1
-
-        match = _REASON_RE.search(line)
-        if match:
-            reasons[match.group(1).strip()] += 1
-        else:
-            for c in recent_comments:
-                if any(k in c.lower() for k in ["reason", "flag", "rfi", "bad", "manual"]):
-                    reasons[c] += 1
-            recent_comments = []
+            commands += 1
+            # One case-insensitive search instead of lowercasing every
+            # command line for two substring probes.
+            if _MANUAL_MODE_RE.search(line):
+                manual_commands += 1
+
+            match = _REASON_RE.search(line)
+            if match:
+                key = match.group(1).strip()
+                reasons[key] = reasons.get(key, 0) + 1
+            else:
+                for c in recent_comments:
+                    if _REASON_KW_RE.search(c):
+                        reasons[c] = reasons.get(c, 0) + 1
+                recent_comments.clear()
 
     return {
         "path": str(path),
@@ -180,12 +234,12 @@ def parse_flag_template(path: Path) -> dict[str, Any]:
         "dr_manual_flag_commands_count": manual_commands,
         "dr_action_evidence": manual_commands > 0,
         "dr_intervention_suspected": manual_commands > 0,
-        "flag_reasons": [{"reason": r, "count": c} for r, c in reasons.most_common(20)],
+        "flag_reasons": _top_reasons(reasons),
     }
 
 
 def parse_pprequest(path: Path) -> dict[str, Any]:
-    root = ET.fromstring(path.read_bytes())
+    root = ET.parse(path).getroot()
     eb_uids: set[str] = set()
     for elem in root.iter():
         if _tag_local(elem.tag).lower() != "intents":
@@ -260,7 +314,11 @@ def _explicit_qa0_by_eb(manifest: dict[str, Any]) -> dict[str, str]:
 
 
 def _summarize_run(run_dir: Path) -> tuple[dict[str, Any], set[str], set[str]]:
-    artifacts = find_run_artifacts(run_dir)
+    # One walk serves both classification and the file inventory below;
+    # calling find_run_artifacts and _iter_files separately traversed the
+    # whole run tree twice.
+    paths = _iter_files(run_dir)
+    artifacts = _classify_paths(run_dir, paths)
     ppr_entries = []
     ppr_ebs: set[str] = set()
     for item in artifacts.get("pprequest_xml", []):
@@ -277,7 +335,7 @@ def _summarize_run(run_dir: Path) -> tuple[dict[str, Any], set[str], set[str]]:
     dr_flags_total = 0
     dr_manual_total = 0
     dr_action_evidence = False
-    reason_counts: Counter[str] = Counter()
+    reason_counts: dict[str, int] = {}
     for item in artifacts.get("flag_templates", []):
         try:
             parsed = parse_flag_template(Path(item))
@@ -286,7 +344,8 @@ def _summarize_run(run_dir: Path) -> tuple[dict[str, Any], set[str], set[str]]:
             dr_manual_total += int(parsed.get("dr_manual_flag_commands_count") or 0)
             dr_action_evidence = dr_action_evidence or bool(parsed.get("dr_action_evidence"))
             for reason in parsed.get("flag_reasons", []):
-                reason_counts[str(reason.get("reason"))] += int(reason.get("count") or 0)
+                key = str(reason.get("reason"))
+                reason_counts[key] = reason_counts.get(key, 0) + int(reason.get("count") or 0)
         except Exception as exc:  # noqa: BLE001
             LOGGER.warning("Failed parsing flag template %s: %s", item, exc)
 
@@ -302,7 +361,7 @@ def _summarize_run(run_dir: Path) -> tuple[dict[str, Any], set[str], set[str]]:
             LOGGER.warning("Failed parsing AQUA report %s: %s", item, exc)
             aqua_reports.append({"path": item, "error": str(exc), "qa_reasons": []})
 
-    run_file_paths = [str(p) for p in _iter_files(run_dir)]
+    run_file_paths = [str(p) for p in paths]
     eb_uids_detected = (
         set(ppr_ebs)
         | _extract_eb_uids_from_text(run_file_paths)
@@ -324,9 +383,7 @@ def _summarize_run(run_dir: Path) -> tuple[dict[str, Any], set[str], set[str]]:
         "dr_action_evidence": dr_action_evidence,
         "dr_flag_commands_count": dr_flags_total,
         "dr_manual_flag_commands_count": dr_manual_total,
-        "dr_flag_reason_summary": [
-            {"reason": reason, "count": count} for reason, count in reason_counts.most_common(20)
-        ],
+        "dr_flag_reason_summary": _top_reasons(reason_counts),
         "qa_report_files": sorted(artifacts.get("qa_report_files", [])),
         "qa_files": sorted(artifacts.get("qa_files", [])),
         "aqua_reports": aqua_reports,
@@ -343,8 +400,16 @@ def summarize_mous(
     query_timestamp: str | None,
     tool_version: str,
     write_markdown: bool,
-) -> dict[str, Any]:
-    manifest = load_json(manifest_path, default={}) or {}
+    manifest: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Build and write the per-MOUS summary.
+
+    Returns ``(summary, manifest)`` so callers that already hold the manifest
+    (or need it afterwards) do not have to re-read the JSON; pass ``manifest=``
+    to skip the read here as well.
+    """
+    if manifest is None:
+        manifest = load_json(manifest_path, default={}) or {}
     summary_path = mous_dir / SUMMARY_FILENAME
 
     run_payloads: dict[str, dict[str, Any]] = {}
@@ -418,10 +483,11 @@ def summarize_mous(
     dr_intervention = bool(run_payloads["delivered"]["dr_action_evidence"]) or bool(
         run_payloads["run1"]["dr_action_evidence"]
     )
-    dr_reasons: Counter[str] = Counter()
+    dr_reasons: dict[str, int] = {}
     for run_name in ("delivered", "run1"):
         for reason in run_payloads[run_name].get("dr_flag_reason_summary", []):
-            dr_reasons[str(reason.get("reason"))] += int(reason.get("count") or 0)
+            key = str(reason.get("reason"))
+            dr_reasons[key] = dr_reasons.get(key, 0) + int(reason.get("count") or 0)
 
     summary = {
         "schema_version": 2,
@@ -447,9 +513,7 @@ def summarize_mous(
             "dr_intervention_suspected": dr_intervention,
             "dr_flag_commands_count": dr_flags_total,
             "dr_manual_flag_commands_count": dr_manual_total,
-            "dr_flag_reason_summary": [
-                {"reason": reason, "count": count} for reason, count in dr_reasons.most_common(20)
-            ],
+            "dr_flag_reason_summary": _top_reasons(dr_reasons),
         },
         "artifacts_present": [
             {
@@ -489,4 +553,4 @@ def summarize_mous(
         ]
         atomic_write_text(mous_dir / "summary.md", "\n".join(lines) + "\n")
 
-    return summary
+    return summary, manifest
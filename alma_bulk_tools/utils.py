@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
@@ -49,26 +50,30 @@ def atomic_write_text(path: Path, content: str) -> None:
     os.replace(tmp, path)
 
 
+# One pre-configured encoder for every manifest/summary write; json.dumps
+# builds a fresh JSONEncoder on each call.
+_JSON_ENCODER = json.JSONEncoder(indent=2, sort_keys=True)
+
+
 def atomic_write_json(path: Path, payload: dict[str, Any]) -> None:
-    atomic_write_text(path, json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    atomic_write_text(path, _JSON_ENCODER.encode(payload) + "\n")
 
 
 def load_json(path: Path, default: Any = None) -> Any:
-    if not path.exists():
+    # read_bytes + loads beats streaming json.load on these file sizes, and
+    # catching the miss avoids a separate exists() stat.
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
         return default
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return json.loads(data)
 
 
-def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    digest = hashlib.sha256()
+def sha256_file(path: Path) -> str:
+    # hashlib.file_digest reads and hashes in C, releasing the GIL, so
+    # concurrent hashing threads actually overlap.
     with path.open("rb") as handle:
-        while True:
-            chunk = handle.read(chunk_size)
-            if not chunk:
-                break
-            digest.update(chunk)
-    return digest.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
 
 def chunked(values: list[Any], size: int) -> Iterable[list[Any]]:
@@ -76,6 +81,7 @@ def chunked(values: list[Any], size: int) -> Iterable[list[Any]]:
         yield values[i : i + size]
 
 
+@functools.lru_cache(maxsize=512)
 def parse_band_token(value: str) -> str:
     value = value.strip().upper()
     if value.startswith("BAND"):
@@ -1,4 +1,114 @@
-from alma_bulk_tools.archive_query import build_adql_query, group_rows_to_mous
+import sqlite3
+
+import pytest
+
+from alma_bulk_tools import archive_query
+from alma_bulk_tools.archive_query import (
+    _band_match_clause,
+    _tap_async_url_from_sync,
+    build_adql_query,
+    group_rows_to_mous,
+    run_tap_async,
+)
+
+
+class _FakeResponse:
+    def __init__(self, *, url: str = "", text: str = "", lines: list[str] | None = None) -> None:
+        self.url = url
+        self.text = text
+        self._lines = lines or []
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def iter_lines(self, decode_unicode: bool = False):
+        return iter(self._lines)
+
+    def close(self) -> None:
+        return None
+
+
+def test_tap_async_url_is_derived_from_sync_url() -> None:
+    assert _tap_async_url_from_sync("https://host/tap/sync") == "https://host/tap/async"
+    assert _tap_async_url_from_sync("https://host/tap/sync/") == "https://host/tap/async"
+    assert _tap_async_url_from_sync("https://host/tap") == "https://host/tap/async"
+
+
+def test_run_tap_async_submits_polls_and_streams_result(monkeypatch: pytest.MonkeyPatch) -> None:
+    phases = iter(["EXECUTING", "COMPLETED"])
+    calls: list[str] = []
+
+    def fake_post(url, data=None, timeout=None, headers=None):
+        calls.append(url)
+        assert data["PHASE"] == "RUN"
+        assert data["QUERY"] == "SELECT 1"
+        return _FakeResponse(url=url + "/job42")
+
+    def fake_get(url, timeout=None, headers=None, stream=False):
+        calls.append(url)
+        if url.endswith("/phase"):
+            return _FakeResponse(text=next(phases))
+        return _FakeResponse(lines=["member_ous_uid\tband_list", "uid://A001/X1/X2\t6"])
+
+    monkeypatch.setattr(archive_query.requests, "post", fake_post)
+    monkeypatch.setattr(archive_query.requests, "get", fake_get)
+    monkeypatch.setattr(archive_query.time, "sleep", lambda _seconds: None)
+
+    rows = list(
+        run_tap_async(
+            "https://host/tap/async",
+            "SELECT 1",
+            timeout_sec=30,
+            user_agent="test-agent",
+        )
+    )
+
+    assert rows == [{"member_ous_uid": "uid://A001/X1/X2", "band_list": "6"}]
+    assert calls[0] == "https://host/tap/async"
+    assert calls[1] == "https://host/tap/async/job42/phase"
+    assert calls[-1] == "https://host/tap/async/job42/results/result"
+
+
+def test_run_tap_async_raises_on_error_phase(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        archive_query.requests,
+        "post",
+        lambda url, data=None, timeout=None, headers=None: _FakeResponse(url=url + "/job42"),
+    )
+    monkeypatch.setattr(
+        archive_query.requests,
+        "get",
+        lambda url, timeout=None, headers=None, stream=False: _FakeResponse(text="ERROR"),
+    )
+
+    with pytest.raises(IOError):
+        list(
+            run_tap_async(
+                "https://host/tap/async", "SELECT 1", timeout_sec=30, user_agent="test-agent"
+            )
+        )
+
+
+def test_run_tap_async_raises_when_timeout_budget_is_spent(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        archive_query.requests,
+        "post",
+        lambda url, data=None, timeout=None, headers=None: _FakeResponse(url=url + "/job42"),
+    )
+    monkeypatch.setattr(
+        archive_query.requests,
+        "get",
+        lambda url, timeout=None, headers=None, stream=False: _FakeResponse(text="QUEUED"),
+    )
+
+    with pytest.raises(TimeoutError):
+        list(
+            run_tap_async(
+                "https://host/tap/async", "SELECT 1", timeout_sec=0, user_agent="test-agent"
+            )
+        )
 
 
 def test_build_adql_query_band_filters_match_numeric_band_list() -> None:
@@ -17,8 +127,21 @@ def test_build_adql_query_band_filters_match_numeric_band_list() -> None:
             "max_freq_ghz": None,
         },
     )
-    assert "band_list = '9'" in adql
-    assert "NOT (band_list = '10'" in adql
+    assert "LIKE '%,9,%'" in adql
+    assert "NOT (',' || REPLACE(band_list, ' ', '') || ',' LIKE '%,10,%'" in adql
+
+
+def test_band_match_clause_matches_band_list_variants() -> None:
+    matching = ["3", "3,6", "3, 6", "6,3", "6, 3", "6,3,7", "Band 3", "BAND 3"]
+    non_matching = ["6", "13", "33", "6,13", "13, 6"]
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE obs (band_list TEXT)")
+    for compat in (False, True):
+        clause = _band_match_clause("3", compat=compat)
+        for value in matching + non_matching:
+            hits = conn.execute(f"SELECT COUNT(*) FROM (SELECT ? AS band_list) WHERE {clause}", (value,)).fetchone()[0]
+            expected = 1 if value in matching else 0
+            assert hits == expected, f"compat={compat} value={value!r}"
 
 
 def test_build_adql_query_array_filters_use_antenna_arrays() -> None:
@@ -1,3 +1,5 @@
+import json
+import sqlite3
 from pathlib import Path
 
 from alma_bulk_tools import cli
@@ -43,7 +45,7 @@ def test_discover_cli_writes_editable_candidate_text(monkeypatch, tmp_path: Path
             "SELECT * FROM ivoa.obscore",
         )
 
-    monkeypatch.setattr(cli, "discover_mous", fake_discover_mous)
+    monkeypatch.setattr("alma_bulk_tools.archive_query.discover_mous", fake_discover_mous)
 
     rc = cli.main(
         [
@@ -129,3 +131,78 @@ def test_sample_cli_writes_selected_candidates_and_report(tmp_path: Path, capsys
     assert "selected/population" in report_html
     assert len(supplemental_rows) == 1
     assert ",TP," not in supplemental_text
+
+
+def test_download_record_jobs_matches_sequential_results(monkeypatch, tmp_path: Path) -> None:
+    from alma_bulk_tools.downloader import write_candidates_jsonl
+    from alma_bulk_tools.utils import atomic_write_json
+
+    records = [
+        MousRecord(
+            project_code=f"2024.1.0000{i}.S",
+            member_ous_uid=f"uid://A001/X1/X{i}",
+            group_ous_uid=f"uid://A001/X9/X{i}",
+            eb_uids=[f"uid://A002/X10/X{i}"],
+            band_list=["BAND 6"],
+            release_date="2024-01-15",
+            obs_date="2023-12-20",
+            qa2_passed=True,
+        )
+        for i in range(1, 4)
+    ]
+    candidates = tmp_path / "candidates.jsonl"
+    write_candidates_jsonl(candidates, records, "SELECT 1")
+
+    def fake_download_for_record(*, record, delivered_dir, manifest_path, **kwargs):
+        delivered_dir.mkdir(parents=True, exist_ok=True)
+        filename = f"{record.member_ous_uid.replace('/', '_').replace(':', '_')}.tar"
+        (delivered_dir / filename).write_bytes(b"data")
+        manifest = {
+            "mous_uid": record.member_ous_uid,
+            "project_code": record.project_code,
+            "eb_uids": list(record.eb_uids),
+            "artifacts": [
+                {
+                    "filename": filename,
+                    "kind": "auxiliary",
+                    "status": "present",
+                    "url": "https://host/datalink",
+                    "size_bytes": 4,
+                    "checksum": None,
+                }
+            ],
+        }
+        atomic_write_json(manifest_path, manifest)
+        return manifest
+
+    monkeypatch.setattr("alma_bulk_tools.downloader.download_for_record", fake_download_for_record)
+
+    def snapshot(dest: Path) -> tuple[dict, set, set]:
+        manifests = {
+            path.parent.name: json.loads(path.read_text(encoding="utf-8"))
+            for path in dest.rglob("almaBulkManifest.json")
+        }
+        conn = sqlite3.connect(dest / "alma_index.sqlite")
+        mous = set(
+            conn.execute("SELECT mous_uid, project_code, discovered, downloaded FROM mous")
+        )
+        artifacts = set(conn.execute("SELECT mous_uid, filename, kind, status FROM artifact"))
+        conn.close()
+        return manifests, mous, artifacts
+
+    dest_seq = tmp_path / "seq"
+    dest_thr = tmp_path / "thr"
+    assert cli.main(["download", "--input", str(candidates), "--dest", str(dest_seq)]) == 0
+    assert (
+        cli.main(
+            ["download", "--input", str(candidates), "--dest", str(dest_thr), "--record-jobs", "2"]
+        )
+        == 0
+    )
+
+    seq_manifests, seq_mous, seq_artifacts = snapshot(dest_seq)
+    thr_manifests, thr_mous, thr_artifacts = snapshot(dest_thr)
+    assert len(thr_mous) == 3
+    assert thr_manifests == seq_manifests
+    assert thr_mous == seq_mous
+    assert thr_artifacts == seq_artifacts
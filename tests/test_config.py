@@ -1,3 +1,7 @@
+import json
+import os
+from pathlib import Path
+
 from alma_bulk_tools.config import apply_cli_overrides, load_config
 
 
@@ -12,3 +16,32 @@ def test_apply_cli_overrides_ignores_nested_none_values() -> None:
     )
     assert merged["download"]["max_workers"] == 4
     assert merged["download"]["artifacts"] is None
+
+
+def test_load_config_writes_and_reuses_sidecar_cache(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text("download:\n  max_workers: 7\n", encoding="utf-8")
+    assert load_config(cfg_path)["download"]["max_workers"] == 7
+
+    cache_path = tmp_path / "config.yaml.cache.json"
+    assert json.loads(cache_path.read_text(encoding="utf-8")) == {"download": {"max_workers": 7}}
+
+    # While the cache is at least as new as the YAML it is what gets read.
+    cache_path.write_text(json.dumps({"download": {"max_workers": 9}}), encoding="utf-8")
+    os.utime(cache_path, ns=(cfg_path.stat().st_mtime_ns + 1,) * 2)
+    assert load_config(cfg_path)["download"]["max_workers"] == 9
+
+    # An edited (newer) YAML invalidates the cache and rewrites it.
+    cfg_path.write_text("download:\n  max_workers: 5\n", encoding="utf-8")
+    os.utime(cfg_path, ns=(cache_path.stat().st_mtime_ns + 1,) * 2)
+    assert load_config(cfg_path)["download"]["max_workers"] == 5
+    assert json.loads(cache_path.read_text(encoding="utf-8")) == {"download": {"max_workers": 5}}
+
+
+def test_load_config_skips_cache_when_json_round_trip_differs(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "config.yaml"
+    # JSON would stringify the numeric mapping key, so this must never be cached.
+    cfg_path.write_text("filters:\n  3: keep\n", encoding="utf-8")
+    assert load_config(cfg_path)["filters"][3] == "keep"
+    assert not (tmp_path / "config.yaml.cache.json").exists()
+    assert load_config(cfg_path)["filters"][3] == "keep"
@@ -3,7 +3,13 @@ from pathlib import Path
 
 import pytest
 
-from alma_bulk_tools.index_db import connect_db, init_db, upsert_mous_from_summary
+from alma_bulk_tools.index_db import (
+    connect_db,
+    init_db,
+    merge_attached_db,
+    merge_db,
+    upsert_mous_from_summary,
+)
 
 
 def _minimal_summary(mous_uid: str = "uid://A001/X1/X1") -> dict:
@@ -118,3 +124,77 @@ def test_connect_db_readonly_cannot_write(tmp_path: Path) -> None:
     with pytest.raises(sqlite3.OperationalError):
         ro.execute("INSERT INTO mous (mous_uid) VALUES ('x')")
     ro.close()
+
+
+# --- shard merge paths ---
+
+
+def _make_shard(db_path: Path, mous_uid: str, eb_uid: str, filename: str) -> None:
+    conn = connect_db(db_path)
+    init_db(conn)
+    upsert_mous_from_summary(
+        conn,
+        summary={"mous_uid": mous_uid, "project_code": "2024.1.00001.S", "eb_uid_list": [eb_uid]},
+        manifest={
+            "mous_uid": mous_uid,
+            "artifacts": [{"filename": filename, "kind": "auxiliary", "status": "present"}],
+        },
+        local_dir=str(db_path.parent),
+        shard_id=db_path.stem,
+    )
+    conn.close()
+
+
+def test_merge_attached_db_combines_shards(tmp_path: Path) -> None:
+    shard_a = tmp_path / "part-0001.sqlite"
+    shard_b = tmp_path / "part-0002.sqlite"
+    _make_shard(shard_a, "uid://A001/X1/X1", "uid://A002/X10/X1", "a.tar")
+    _make_shard(shard_b, "uid://A001/X1/X2", "uid://A002/X10/X2", "b.tar")
+
+    central = connect_db(tmp_path / "central.sqlite")
+    merge_attached_db(central, shard_a)
+    merge_attached_db(central, shard_b)
+
+    mous = sorted(row[0] for row in central.execute("SELECT mous_uid FROM mous"))
+    ebs = sorted(row[0] for row in central.execute("SELECT eb_uid FROM eb"))
+    artifacts = sorted(row[0] for row in central.execute("SELECT filename FROM artifact"))
+    central.close()
+    assert mous == ["uid://A001/X1/X1", "uid://A001/X1/X2"]
+    assert ebs == ["uid://A002/X10/X1", "uid://A002/X10/X2"]
+    assert artifacts == ["a.tar", "b.tar"]
+
+
+def test_merge_attached_db_raises_for_legacy_shard_and_merge_db_recovers(tmp_path: Path) -> None:
+    legacy = tmp_path / "legacy.sqlite"
+    source = sqlite3.connect(legacy)
+    source.execute("CREATE TABLE mous (mous_uid TEXT PRIMARY KEY, project_code TEXT)")
+    source.execute("CREATE TABLE eb (mous_uid TEXT, eb_uid TEXT, PRIMARY KEY(mous_uid, eb_uid))")
+    source.execute(
+        "CREATE TABLE artifact (mous_uid TEXT, filename TEXT, kind TEXT, status TEXT, "
+        "PRIMARY KEY(mous_uid, filename))"
+    )
+    source.execute("INSERT INTO mous VALUES ('uid://A001/X1/X9', '2020.1.00009.S')")
+    source.execute("INSERT INTO eb VALUES ('uid://A001/X1/X9', 'uid://A002/X10/X9')")
+    source.execute(
+        "INSERT INTO artifact VALUES ('uid://A001/X1/X9', 'legacy.tar', 'auxiliary', 'present')"
+    )
+    source.commit()
+    source.close()
+
+    central = connect_db(tmp_path / "central.sqlite")
+    init_db(central)
+    with pytest.raises(sqlite3.OperationalError):
+        merge_attached_db(central, legacy)
+
+    # merge-index falls back to the row-by-row merge for shards like this.
+    source = connect_db(legacy)
+    merge_db(source, central)
+    source.close()
+
+    row = central.execute("SELECT mous_uid, project_code, shard_id FROM mous").fetchone()
+    eb = central.execute("SELECT mous_uid, eb_uid FROM eb").fetchone()
+    artifact = central.execute("SELECT filename, kind, status FROM artifact").fetchone()
+    central.close()
+    assert row == ("uid://A001/X1/X9", "2020.1.00009.S", None)
+    assert eb == ("uid://A001/X1/X9", "uid://A002/X10/X9")
+    assert artifact == ("legacy.tar", "auxiliary", "present")
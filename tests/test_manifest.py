@@ -1,6 +1,8 @@
 from pathlib import Path
 
 from alma_bulk_tools.downloader import (
+    _classify_artifact,
+    _normalize_kind,
     datalink_id_from_member_ous_uid,
     read_candidates_jsonl,
     resolve_artifact_selection,
@@ -40,6 +42,21 @@ def test_all_nonimage_excludes_image_products() -> None:
     assert "readme" in selected
 
 
+def test_classify_artifact_returns_normalized_kinds() -> None:
+    # Selection checks compare kinds without re-normalizing, so classification
+    # must emit already strip/lowered values.
+    cases = [
+        ("", None, "member.uid___A001_X1_X2.README.txt"),
+        ("", "#calibration", "member.uid___A001_X1_X2.caltables.tgz"),
+        ("", None, "member.uid___A001_X1_X2.cont.I.tt0.fits"),
+        ("RAW", None, "unclassified.bin"),
+        ("", None, "unclassified.bin"),
+    ]
+    for kind_hint, semantics, filename in cases:
+        kind = _classify_artifact(kind_hint, semantics, filename)
+        assert kind == _normalize_kind(kind)
+
+
 def test_datalink_id_normalization_from_member_ous_uid() -> None:
     assert (
         datalink_id_from_member_ous_uid("uid://A001/X2f6/X2b")
@@ -86,7 +103,7 @@ def test_editable_text_candidate_file_can_feed_download(tmp_path: Path) -> None:
     assert "project_code,science_category,mous_uid" in text
     assert "937.5 MHz,2 GHz" in text
     assert "Galaxy evolution" in text
-    loaded = read_candidates_jsonl(out_path)
+    loaded = list(read_candidates_jsonl(out_path))
 
     assert len(loaded) == 1
     assert loaded[0].member_ous_uid == "uid://A001/X1/X2"
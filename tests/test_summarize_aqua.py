@@ -66,7 +66,7 @@ def test_summarize_builds_run_level_summary(tmp_path: Path) -> None:
         },
     )
 
-    summary = summarize_mous(
+    summary, _manifest = summarize_mous(
         mous_dir=mous_dir,
         manifest_path=manifest_path,
         query_timestamp="2026-02-15T00:00:00Z",
@@ -106,7 +106,7 @@ def test_summarize_infers_qa0_from_run_membership(tmp_path: Path) -> None:
         },
     )
 
-    summary = summarize_mous(
+    summary, _manifest = summarize_mous(
         mous_dir=mous_dir,
         manifest_path=manifest_path,
         query_timestamp="2026-02-15T00:00:00Z",